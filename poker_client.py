@@ -2,11 +2,55 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 import socket
 import threading
+import selectors
 import json
 import uuid
 import os
+from collections import deque
+from dataclasses import dataclass, field
+from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image, ImageTk
 
+try:
+    import orjson # Optional: faster JSON codec that reads and writes bytes directly
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+    def _dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+# Display text for each server game state
+_GAME_STATE_LABELS = {
+    'waiting': 'Waiting for players...',
+    'dealing': 'Dealing cards...',
+    'pre_flop': 'Pre-Flop',
+    'flop': 'Flop',
+    'turn': 'Turn',
+    'river': 'River',
+    'showdown': 'Showdown',
+    'game_over': 'Game Over'
+}
+
+# Game states in which players can act
+_ACTIVE_STATES = frozenset({'pre_flop', 'flop', 'turn', 'river'})
+
+@dataclass(slots=True)
+class PlayerWidgetCache:
+    """Persistent widgets for another player's seat, plus the values they currently show"""
+    frame: tk.Frame
+    name_lbl: tk.Label
+    chips_lbl: tk.Label
+    bet_lbl: tk.Label
+    status_lbl: tk.Label
+    cards_frame: tk.Frame
+    card_lbls: List[dict] = field(default_factory=list) # Reusable card label slots
+    last_name: Optional[str] = None
+    last_chips: Optional[int] = None
+    last_bet: Optional[int] = None
+    last_status: Optional[str] = None
+
 class PokerClient:
     def __init__(self):
         self.root = tk.Tk()
@@ -17,6 +61,10 @@ class PokerClient:
         # Network settings
         self.socket = None
         self.connected = False
+        self._recv_buf = b'' # Bytes received but not yet terminated by a newline
+        self._recv_view = memoryview(bytearray(65536)) # Reused for every recv_into call
+        self._last_update_hash = None # Hash of the last game_update frame, to drop exact repeats
+        self._msg_queue = deque() # Decoded messages waiting to be handled on the Tk thread
         self.player_id = str(uuid.uuid4())
         self.player_name = ""
         
@@ -26,35 +74,48 @@ class PokerClient:
         self.community_cards = []
         self.current_player_id = None # To explicitly track whose turn it is
         self.dealer_player_id = None # To explicitly track the dealer
+        self._pending_game_update = None # Latest game_update not yet rendered
+        self._update_scheduled = False
         
-        # Card images
+        # Card images (filled in by a background thread once decoded)
         self.card_images = {}
+        self._get_card_img = self.card_images.get # Bound once, used on every UI refresh
         self.card_back_image = None
-        self.load_card_images()
         
         self.player_widgets = {} # To store references to player UI elements
+        self.community_card_slots = [] # Reusable community card labels
+        self.my_card_slots = [] # Reusable labels for my hole cards
+        # Last applied action button states (all buttons start disabled) and Call button text
+        self._btn_states = {'fold': False, 'check': False, 'call': False, 'raise': False, 'all_in': False}
+        self._call_btn_text = "Call"
         
         self.setup_ui()
         self.setup_connection_dialog()
         
-    def load_card_images(self):
-        """Load all card images from the cards folder"""
+        # Load card images without holding up the UI; cards render once they are installed
+        threading.Thread(target=self._async_load_images, daemon=True).start()
+        
+    def _async_load_images(self):
+        """Load all card images from the cards folder (runs on a background thread)"""
         cards_folder = "cards"
-        if not os.path.exists(cards_folder):
-            messagebox.showerror("Error", "Cards folder not found! Please create a 'cards' folder with card images (e.g., heart_ace.jpg, back_design.jpg).")
+        try:
+            # One directory listing instead of probing each of the 53 files separately
+            available = {entry.name for entry in os.scandir(cards_folder)}
+        except FileNotFoundError:
+            self.root.after(0, lambda: messagebox.showerror("Error", "Cards folder not found! Please create a 'cards' folder with card images (e.g., heart_ace.jpg, back_design.jpg)."))
             return
         
         try:
-            # Load card back - changed to back_design.jpg
+            to_load = []
+            
+            # Card back - changed to back_design.jpg
             back_path = os.path.join(cards_folder, "back_design.jpg")
-            if os.path.exists(back_path):
-                img = Image.open(back_path)
-                img = img.resize((60, 84), Image.Resampling.LANCZOS)
-                self.card_back_image = ImageTk.PhotoImage(img)
+            if "back_design.jpg" in available:
+                to_load.append((None, back_path))
             else:
                 print(f"Warning: {back_path} not found. Using placeholder if available.")
             
-            # Load all card faces
+            # All card faces
             suits = ['club', 'diamond', 'heart', 'spade']
             ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'jack', 'queen', 'king', 'ace']
             
@@ -62,16 +123,42 @@ class PokerClient:
                 for rank in ranks:
                     filename = f"{suit}_{rank}.jpg"
                     filepath = os.path.join(cards_folder, filename)
-                    if os.path.exists(filepath):
-                        img = Image.open(filepath)
-                        img = img.resize((60, 84), Image.Resampling.LANCZOS)
-                        self.card_images[filename] = ImageTk.PhotoImage(img)
+                    if filename in available:
+                        to_load.append((filename, filepath))
                     else:
                         print(f"Warning: {filepath} not found.")
+            
+            # Decode and resize in worker threads (Pillow releases the GIL while doing so)
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                decoded = list(pool.map(self._decode_card_image, [filepath for _, filepath in to_load]))
+            
+            # PhotoImage objects must be created on the Tk thread
+            self.root.after(0, self._install_photoimages, [(filename, img) for (filename, _), img in zip(to_load, decoded)])
                         
         except Exception as e:
             print(f"Error loading card images: {e}")
-            messagebox.showwarning("Warning", "Some card images could not be loaded. Please ensure 'cards' folder contains all necessary .jpg files.")
+            self.root.after(0, lambda: messagebox.showwarning("Warning", "Some card images could not be loaded. Please ensure 'cards' folder contains all necessary .jpg files."))
+    
+    def _install_photoimages(self, decoded):
+        """Wrap decoded images as PhotoImages on the Tk thread and redraw with them"""
+        for filename, img in decoded:
+            if filename is None:
+                self.card_back_image = ImageTk.PhotoImage(img)
+            else:
+                self.card_images[filename] = ImageTk.PhotoImage(img)
+        
+        # Cards drawn before the images were ready were left blank; draw them now
+        if self.game_data:
+            self.update_game_state(self.game_data)
+    
+    @staticmethod
+    def _decode_card_image(filepath):
+        """Open and resize a single card image; safe to run off the Tk thread"""
+        img = Image.open(filepath)
+        # Let libjpeg decode at a reduced scale, then finish with a cheap filter at thumbnail size.
+        # reducing_gap box-reduces first whenever draft() could not shrink the source enough.
+        img.draft('RGB', (120, 168))
+        return img.resize((60, 84), Image.Resampling.BILINEAR, reducing_gap=2.0)
     
     def setup_connection_dialog(self):
         """Show connection dialog at startup"""
@@ -221,6 +308,7 @@ class PokerClient:
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.connect((server_ip, port))
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) # Send small action messages without Nagle delay
             self.connected = True
             
             # Send join message immediately after connecting
@@ -229,7 +317,7 @@ class PokerClient:
                 'player_id': self.player_id,
                 'name': self.player_name
             }
-            self.socket.send(json.dumps(join_message).encode('utf-8') + b'\n') # Add newline for server parsing
+            self._send_json(join_message)
             
             # Start listening thread
             listen_thread = threading.Thread(target=self.listen_to_server)
@@ -243,34 +331,86 @@ class PokerClient:
     
     def listen_to_server(self):
         """Listen for messages from the server"""
-        while self.connected:
-            try:
-                data = self.socket.recv(4096).decode('utf-8')
-                if not data:
-                    break # Server disconnected
+        # Wait with a timeout so the thread notices a local disconnect instead of blocking in recv forever
+        selector = selectors.DefaultSelector()
+        selector.register(self.socket, selectors.EVENT_READ)
+        try:
+            while self.connected:
+                try:
+                    if not selector.select(timeout=0.5):
+                        continue # Nothing to read yet, re-check the connection flag
+                    
+                    n = self.socket.recv_into(self._recv_view)
+                    if not n:
+                        break # Server disconnected
+                
+                    # Only parse complete newline-terminated messages; keep any partial tail for the next recv
+                    buf = self._recv_buf + self._recv_view[:n]
+                    start = 0
+                    end = buf.find(b'\n')
+                    while end != -1: # Slice out one frame at a time rather than splitting the whole buffer
+                        frame = buf[start:end]
+                        start = end + 1
+                        end = buf.find(b'\n', start)
+                        if frame.strip(): # Ensure it's not an empty line
+                            frame_hash = hash(frame)
+                            if frame_hash == self._last_update_hash:
+                                continue # Byte-identical to the game_update already shown, nothing to redraw
+                            try:
+                                message = _loads(frame)
+                                if message.get('type') == 'game_update':
+                                    self._last_update_hash = frame_hash
+                                self._msg_queue.append(message)
+                            except json.JSONDecodeError:
+                                print(f"Invalid JSON received: {frame!r}")
+                    self._recv_buf = buf[start:]
                 
-                # Handle potential partial messages (if multiple messages are sent in one packet)
-                messages = data.split('\n') # Assuming server sends newline after each JSON
-                for msg_str in messages:
-                    if msg_str.strip(): # Ensure it's not an empty string
-                        try:
-                            message = json.loads(msg_str)
-                            self.root.after(0, lambda m=message: self.handle_server_message(m))
-                        except json.JSONDecodeError:
-                            print(f"Invalid JSON received: {msg_str}")
+                    # One Tk callback per recv handles every message it completed
+                    if self._msg_queue:
+                        self.root.after(0, self._drain_msg_queue)
                 
-            except Exception as e:
-                print(f"Listen error: {e}")
-                break
+                except Exception as e:
+                    if self.connected: # Errors after a local close are expected
+                        print(f"Listen error: {e}")
+                    break
+        finally:
+            selector.close()
+        
+        if not self.connected:
+            return # Disconnected on our side, which already handled closing the app
         
         self.connected = False
         self.root.after(0, lambda: messagebox.showinfo("Disconnected", "Lost connection to server. The game will now close."))
         self.root.after(0, self.root.quit) # Close application on disconnect
         
+    def _drain_msg_queue(self):
+        """Handle queued server messages in the order they arrived"""
+        while self._msg_queue:
+            self.handle_server_message(self._msg_queue.popleft())
+    
     def handle_server_message(self, message):
         """Handle messages from the server"""
         msg_type = message.get('type')
         
+        if msg_type == 'game_update':
+            game_data = message.get('data')
+            # The shared state shows every hole card face down; our own cards come in 'private'
+            private = message.get('private')
+            if private and game_data:
+                me = game_data.get('players', {}).get(self.player_id)
+                if me is not None:
+                    me['cards'] = private['cards']
+            # Coalesce bursts of updates so only the latest one gets rendered
+            self._pending_game_update = game_data
+            if not self._update_scheduled:
+                self._update_scheduled = True
+                self.root.after(16, self._flush_game_update)
+            return
+        
+        # Render any pending update first so other messages see the state they followed
+        if self._update_scheduled:
+            self._flush_game_update()
+        
         if msg_type == 'join_success':
             self.update_status("Connected to game!")
             self.my_name_label.config(text=f"Player: {self.player_name}")
@@ -279,9 +419,6 @@ class PokerClient:
             messagebox.showerror("Error", message.get('message'))
             self.root.quit() # Exit if unable to join
             
-        elif msg_type == 'game_update':
-            self.update_game_state(message.get('data'))
-            
         elif msg_type == 'game_started':
             self.update_status("Game started!")
             
@@ -293,20 +430,21 @@ class PokerClient:
             winning_hand_type = message.get('winning_hand_type', 'Unknown Hand') # Get the winning hand type
             
             # Ensure game_data['players'] is populated before accessing
-            if 'players' in self.game_data:
-                winner_names = [self.game_data['players'][pid]['name'] for pid in winners if pid in self.game_data['players']]
+            players = self.game_data.get('players')
+            if players:
+                winner_names = [players[pid]['name'] for pid in winners if pid in players]
+                joined_names = ', '.join(winner_names)
                 
                 # Construct the message with the winning hand type
-                display_message = message.get('message', f"The winner(s) are: {', '.joiwinnern(winner_names)}!")
+                display_message = message.get('message') or f"The winner(s) are: {joined_names}!"
                 if self.player_id in winners:
-                    display_message += f"\n\nYou won with a {winning_hand_type}!"
-                else:
+                    display_message = f"{display_message}\n\nYou won with a {winning_hand_type}!"
+                elif len(winner_names) == 1:
                     # If not the winner, show what the winner had
-                    if len(winners) == 1:
-                        display_message += f"\n\n{winner_names[0]} won with a {winning_hand_type}!"
+                    display_message = f"{display_message}\n\n{winner_names[0]} won with a {winning_hand_type}!"
 
                 messagebox.showinfo("Game Result", display_message)
-                self.update_status(f"Winners: {', '.join(winner_names)} (Winning Hand: {winning_hand_type})")
+                self.update_status(f"Winners: {joined_names} (Winning Hand: {winning_hand_type})")
             else:
                 messagebox.showinfo("Game Result", message.get('message'))
                 self.update_status("Game ended.")
@@ -314,6 +452,15 @@ class PokerClient:
         elif msg_type == 'error':
             messagebox.showerror("Server Error", message.get('message'))
     
+    def _flush_game_update(self):
+        """Render the most recent game_update received since the last flush"""
+        if not self._update_scheduled:
+            return # Already flushed early by another message
+        game_data = self._pending_game_update
+        self._pending_game_update = None
+        self._update_scheduled = False
+        self.update_game_state(game_data)
+    
     def update_game_state(self, game_data):
         """Update the UI with new game state"""
         if not game_data:
@@ -326,34 +473,33 @@ class PokerClient:
         # Update pot and game state label
         self.pot_label.config(text=f"Pot: ${game_data.get('pot', 0)}")
         
+        players = game_data.get('players', {})
         game_state = game_data.get('game_state', 'waiting')
-        state_text = {
-            'waiting': 'Waiting for players...',
-            'dealing': 'Dealing cards...',
-            'pre_flop': 'Pre-Flop',
-            'flop': 'Flop',
-            'turn': 'Turn',
-            'river': 'River',
-            'showdown': 'Showdown',
-            'game_over': 'Game Over'
-        }.get(game_state, game_state.title())
+        state_text = _GAME_STATE_LABELS.get(game_state, game_state.title())
         
         if self.current_player_id == self.player_id:
             state_text += " - Your Turn!"
-        elif self.current_player_id and self.current_player_id in self.game_data.get('players', {}):
-            current_player_name = self.game_data['players'][self.current_player_id]['name']
+        elif self.current_player_id in players:
+            current_player_name = players[self.current_player_id]['name']
             state_text += f" - {current_player_name}'s Turn"
             
         self.game_state_label.config(text=state_text)
         
+        # Resolve each distinct card image once for this update (hidden cards all share one)
+        community_cards = game_data.get('community_cards', [])
+        image_names = {card_data['image'] for card_data in community_cards}
+        for player_data in players.values():
+            image_names.update(card_data['image'] for card_data in player_data.get('cards', []))
+        resolved = {name: self._get_card_img(name) for name in image_names}
+        
         # Update community cards
-        self.update_community_cards(game_data.get('community_cards', []))
+        self.update_community_cards(community_cards, resolved)
         
         # Update players
-        self.update_players(game_data.get('players', {}))
+        self.update_players(players, resolved)
         
         # Update action buttons
-        self.update_action_buttons(self.current_player_id == self.player_id and game_state in ['pre_flop', 'flop', 'turn', 'river'])
+        self.update_action_buttons(self.current_player_id == self.player_id and game_state in _ACTIVE_STATES)
         
         # Control Start New Hand button visibility
         if game_state == 'waiting' or game_state == 'game_over':
@@ -361,172 +507,201 @@ class PokerClient:
         else:
             self.start_btn.config(state=tk.DISABLED)
             
-    def update_community_cards(self, cards):
-        """Update community cards display"""
-        for widget in self.community_cards_frame.winfo_children():
-            widget.destroy()
-        
-        for card_data in cards:
-            card_image = self.card_images.get(card_data['image'])
-            if card_image:
-                label = tk.Label(self.community_cards_frame, image=card_image, bg='#0D4F3C')
-                label.pack(side=tk.LEFT, padx=2)
-            
+    def update_community_cards(self, cards, resolved):
+        """Update community cards display, using the image names already resolved for this update"""
+        images = [resolved[card_data['image']] for card_data in cards]
         # Add placeholders for remaining community cards if fewer than 5
-        for i in range(len(cards), 5):
-            if self.card_back_image:
-                label = tk.Label(self.community_cards_frame, image=self.card_back_image, bg='#0D4F3C')
-                label.pack(side=tk.LEFT, padx=2)
+        images.extend([self.card_back_image] * (5 - len(images)))
+        self._update_card_row(self.community_card_slots, self.community_cards_frame, images, '#0D4F3C', 2)
     
-    def update_players(self, players_data):
-        """Update players display"""
-        # Clear existing player widgets (except my own)
-        for widget in self.other_players_frame.winfo_children():
-            widget.destroy()
-        self.player_widgets.clear() # Clear stored widgets as well
-
+    def _update_card_row(self, row, parent, images, bg, padx):
+        """Show the given images in a row of reusable card labels, hiding any spare labels"""
+        for i, card_image in enumerate(images):
+            if i == len(row):
+                row.append({'label': tk.Label(parent, bg=bg), '_last_image': None})
+            slot = row[i]
+            if slot['_last_image'] is card_image:
+                continue # Already showing this card
+            if card_image:
+                slot['label'].config(image=card_image)
+                slot['label'].grid(row=0, column=i, padx=padx)
+            else:
+                slot['label'].grid_remove()
+            slot['_last_image'] = card_image
+        
+        for slot in row[len(images):]:
+            if slot['_last_image'] is not None:
+                slot['label'].grid_remove()
+                slot['_last_image'] = None
+    
+    def _create_player_widgets(self):
+        """Build the widget tree for another player's seat once; later updates only reconfigure it"""
+        player_frame = tk.Frame(self.other_players_frame, bg='#2E7D32', relief=tk.RAISED, bd=1)
+        player_frame.pack(side=tk.LEFT, padx=5, pady=5, fill=tk.Y, expand=True) # Use expand for even distribution
+        
+        name_label = tk.Label(player_frame, bg='#2E7D32', fg='white', font=('Arial', 10, 'bold'))
+        name_label.pack(padx=5, pady=2)
+        
+        chips_label = tk.Label(player_frame, bg='#2E7D32', fg='white', font=('Arial', 9))
+        chips_label.pack(padx=5)
+        
+        bet_label = tk.Label(player_frame, bg='#2E7D32', fg='yellow', font=('Arial', 9))
+        bet_label.pack(padx=5)
+        
+        status_label = tk.Label(player_frame, bg='#2E7D32', fg='white', font=('Arial', 8, 'bold'))
+        status_label.pack(padx=5)
+        
+        cards_frame = tk.Frame(player_frame, bg='#2E7D32')
+        cards_frame.pack(padx=5, pady=2)
+        
+        return PlayerWidgetCache(player_frame, name_label, chips_label, bet_label, status_label, cards_frame)
+    
+    def update_players(self, players_data, resolved):
+        """Update players display, using the image names already resolved for this update"""
         # Update my player info and cards
         if self.player_id in players_data:
             my_data = players_data[self.player_id]
             self.my_chips_label.config(text=f"Chips: ${my_data.get('chips', 0)}")
             self.my_bet_label.config(text=f"Current Bet: ${my_data.get('current_bet', 0)}")
-            self.update_my_cards(my_data.get('cards', []))
-        
-        # Display other players
-        player_keys_ordered = list(players_data.keys())
-        if self.player_id in player_keys_ordered:
-            my_index = player_keys_ordered.index(self.player_id)
-            # Sort players so 'my' player is at the bottom, and others are arranged around the top
-            # Simple sorting for display: put current player's ID first, then others
-            sorted_pids = [self.player_id] + [pid for pid in player_keys_ordered if pid != self.player_id]
+            self.update_my_cards(my_data.get('cards', []), resolved)
+        
+        # Remove widgets of players who left (or everyone, if I'm no longer seated)
+        for pid in list(self.player_widgets):
+            if pid not in players_data or self.player_id not in players_data:
+                self.player_widgets.pop(pid).frame.destroy()
+        
+        if self.player_id not in players_data:
+            return
+        
+        # Display other players, skipping my own ID
+        for pid, player_data in players_data.items():
+            if pid == self.player_id:
+                continue
             
-            # For displaying other players, skip my own ID
-            for pid in sorted_pids:
-                if pid == self.player_id:
-                    continue 
-
-                player_data = players_data[pid]
-                player_frame = tk.Frame(self.other_players_frame, bg='#2E7D32', relief=tk.RAISED, bd=1)
-                player_frame.pack(side=tk.LEFT, padx=5, pady=5, fill=tk.Y, expand=True) # Use expand for even distribution
-                self.player_widgets[pid] = player_frame # Store for later updates
-
-                # Player name
-                name_text = player_data.get('name', 'Unknown')
-                if pid == self.dealer_player_id:
-                    name_text += " (D)" # Mark dealer
-                
-                name_label = tk.Label(player_frame, text=name_text, 
-                                     bg='#2E7D32', fg='white', font=('Arial', 10, 'bold'))
-                name_label.pack(padx=5, pady=2)
-                
-                # Player chips
-                chips_label = tk.Label(player_frame, text=f"${player_data.get('chips', 0)}", 
-                                     bg='#2E7D32', fg='white', font=('Arial', 9))
-                chips_label.pack(padx=5)
-                
-                # Player bet
-                bet = player_data.get('current_bet', 0)
-                bet_label = tk.Label(player_frame, text=f"Bet: ${bet}", 
-                                     bg='#2E7D32', fg='yellow', font=('Arial', 9))
-                bet_label.pack(padx=5)
-
-                # Player status
-                status_text = ""
-                status_color = 'white'
-                if player_data.get('is_folded'):
-                    status_text = "FOLDED"
-                    status_color = 'red'
-                elif player_data.get('is_all_in'):
-                    status_text = "ALL IN"
-                    status_color = 'orange'
-                elif pid == self.current_player_id:
-                    status_text = "TO ACT"
-                    status_color = 'cyan'
-                
-                status_label = tk.Label(player_frame, text=status_text, 
-                                        bg='#2E7D32', fg=status_color, font=('Arial', 8, 'bold'))
-                status_label.pack(padx=5)
-                
-                # Player cards
-                cards_frame = tk.Frame(player_frame, bg='#2E7D32')
-                cards_frame.pack(padx=5, pady=2)
-
-                for card_data in player_data.get('cards', []):
-                    card_image = self.card_images.get(card_data['image'])
-                    if not card_image: # Fallback to card back if specific image not found
-                        card_image = self.card_back_image
-                    
-                    card_label = tk.Label(cards_frame, image=card_image, bg='#2E7D32')
-                    card_label.pack(side=tk.LEFT, padx=1)
+            widgets = self.player_widgets.get(pid)
+            if widgets is None:
+                widgets = self._create_player_widgets()
+                self.player_widgets[pid] = widgets # Store for later updates
+            
+            # Player name
+            name_text = player_data.get('name', 'Unknown')
+            if pid == self.dealer_player_id:
+                name_text += " (D)" # Mark dealer
+            if name_text != widgets.last_name:
+                widgets.name_lbl.config(text=name_text)
+                widgets.last_name = name_text
+            
+            # Player chips
+            chips = player_data.get('chips', 0)
+            if chips != widgets.last_chips:
+                widgets.chips_lbl.config(text=f"${chips}")
+                widgets.last_chips = chips
+            
+            # Player bet
+            bet = player_data.get('current_bet', 0)
+            if bet != widgets.last_bet:
+                widgets.bet_lbl.config(text=f"Bet: ${bet}")
+                widgets.last_bet = bet
+            
+            # Player status
+            status_text = ""
+            status_color = 'white'
+            if player_data.get('is_folded'):
+                status_text = "FOLDED"
+                status_color = 'red'
+            elif player_data.get('is_all_in'):
+                status_text = "ALL IN"
+                status_color = 'orange'
+            elif pid == self.current_player_id:
+                status_text = "TO ACT"
+                status_color = 'cyan'
+            if status_text != widgets.last_status:
+                widgets.status_lbl.config(text=status_text, fg=status_color)
+                widgets.last_status = status_text
+            
+            # Player cards, falling back to card back if specific image not found
+            images = [resolved[card_data['image']] or self.card_back_image
+                      for card_data in player_data.get('cards', [])]
+            self._update_card_row(widgets.card_lbls, widgets.cards_frame, images, '#2E7D32', 1)
     
-    def update_my_cards(self, cards):
-        """Update my cards display"""
-        for widget in self.my_cards_display_frame.winfo_children():
-            widget.destroy()
-        
-        for card_data in cards:
-            card_image = self.card_images.get(card_data['image'])
-            if card_image:
-                label = tk.Label(self.my_cards_display_frame, image=card_image, bg='#1A5D4A')
-                label.pack(side=tk.LEFT, padx=2)
+    def update_my_cards(self, cards, resolved):
+        """Update my cards display, using the image names already resolved for this update"""
+        images = [resolved[card_data['image']] for card_data in cards]
+        self._update_card_row(self.my_card_slots, self.my_cards_display_frame, images, '#1A5D4A', 2)
     
     def update_action_buttons(self, is_my_turn):
         """Update action buttons based on game state and current player"""
-        # Disable all buttons initially
-        self.fold_btn.config(state=tk.DISABLED)
-        self.check_btn.config(state=tk.DISABLED)
-        self.call_btn.config(state=tk.DISABLED)
-        self.raise_btn.config(state=tk.DISABLED)
-        self.all_in_btn.config(state=tk.DISABLED)
-
-        if not is_my_turn or not self.game_data:
-            return
+        wanted, call_text = self._wanted_button_states(is_my_turn)
+        
+        # Only touch the buttons whose state actually changed
+        for name, enabled in wanted.items():
+            if enabled != self._btn_states[name]:
+                getattr(self, f'{name}_btn').config(state=tk.NORMAL if enabled else tk.DISABLED)
+                self._btn_states[name] = enabled
+        
+        if call_text is not None and call_text != self._call_btn_text:
+            self.call_btn.config(text=call_text)
+            self._call_btn_text = call_text
+    
+    def _wanted_button_states(self, is_my_turn):
+        """Work out which action buttons should be enabled, and the Call button text (None to leave it)"""
+        # All buttons disabled unless enabled below
+        wanted = {'fold': False, 'check': False, 'call': False, 'raise': False, 'all_in': False}
+        
+        game_data = self.game_data
+        if not is_my_turn or not game_data:
+            return wanted, None
             
-        players = self.game_data.get('players', {})
-        my_data = players.get(self.player_id)
+        my_data = game_data.get('players', {}).get(self.player_id)
+        if not my_data:
+            return wanted, None
         
-        if not my_data or my_data.get('is_folded') or my_data.get('is_all_in') or my_data.get('chips', 0) <= 0:
-            return # Player cannot act
+        my_chips = my_data.get('chips', 0)
+        if my_data.get('is_folded') or my_data.get('is_all_in') or my_chips <= 0:
+            return wanted, None # Player cannot act
         
-        current_bet = self.game_data.get('current_bet', 0)
+        current_bet = game_data.get('current_bet', 0)
         my_bet = my_data.get('current_bet', 0)
-        my_chips = my_data.get('chips', 0)
+        call_text = None
         
-        self.fold_btn.config(state=tk.NORMAL) # Fold is always an option if you can act
+        wanted['fold'] = True # Fold is always an option if you can act
         
         # Determine Check/Call
         if current_bet == my_bet:
-            self.check_btn.config(state=tk.NORMAL)
-            self.call_btn.config(text="Call") # Reset text if it was showing amount
+            wanted['check'] = True
+            call_text = "Call" # Reset text if it was showing amount
         else:
             call_amount = current_bet - my_bet
             if my_chips >= call_amount:
-                self.call_btn.config(state=tk.NORMAL, text=f"Call ${call_amount}")
-            else: # Not enough chips to call, can only go all-in or fold
-                # If they can't call, their "call" is effectively an all-in
-                self.call_btn.config(state=tk.DISABLED) 
+                wanted['call'] = True
+                call_text = f"Call ${call_amount}"
+            # Otherwise not enough chips to call, can only go all-in or fold
+            # If they can't call, their "call" is effectively an all-in
                 
         # Raise button logic
         # Player must have enough chips to at least call the current bet AND then raise.
         # Min raise is typically the size of the big blind, or the size of the previous raise.
         # For simplicity, let's use big blind as min increment for raise.
         
-        min_raise_increment = self.game_data.get('big_blind', 20)
-        
-        # The amount to match the current bet
-        amount_to_match = current_bet - my_bet
+        min_raise_increment = game_data.get('big_blind', 20)
 
         # Minimum total bet for a raise (current_bet + min_raise_increment)
         min_total_raise_amount = current_bet + min_raise_increment
 
         # Player must have enough chips to at least make the minimum raise
         if my_chips >= min_total_raise_amount - my_bet:
-            self.raise_btn.config(state=tk.NORMAL)
+            wanted['raise'] = True
         
         # All-in button is always available if player has chips
         if my_chips > 0:
-            self.all_in_btn.config(state=tk.NORMAL)
+            wanted['all_in'] = True
+        
+        return wanted, call_text
 
+    def _send_json(self, message):
+        """Send one JSON message to the server, newline-terminated for server parsing"""
+        self.socket.sendall(_dumps(message) + b'\n')
+    
     def send_action(self, action, amount=0):
         """Send action to server"""
         if not self.connected:
@@ -541,7 +716,7 @@ class PokerClient:
         }
         
         try:
-            self.socket.send(json.dumps(message).encode('utf-8') + b'\n') # Add newline for server parsing
+            self._send_json(message)
         except Exception as e:
             print(f"Error sending action: {e}")
             self.connected = False # Assume disconnection
@@ -558,11 +733,12 @@ class PokerClient:
     
     def call_action(self):
         """Call action"""
-        if not self.game_data or self.player_id not in self.game_data.get('players', {}):
+        game_data = self.game_data
+        my_data = game_data.get('players', {}).get(self.player_id)
+        if my_data is None:
             return
         
-        my_data = self.game_data['players'][self.player_id]
-        current_bet = self.game_data.get('current_bet', 0)
+        current_bet = game_data.get('current_bet', 0)
         my_bet = my_data.get('current_bet', 0)
         call_amount_needed = current_bet - my_bet
         
@@ -574,15 +750,16 @@ class PokerClient:
     
     def raise_action(self):
         """Raise action"""
-        if not self.game_data or self.player_id not in self.game_data.get('players', {}):
+        game_data = self.game_data
+        my_data = game_data.get('players', {}).get(self.player_id)
+        if my_data is None:
             return
             
-        my_data = self.game_data['players'][self.player_id]
-        current_bet = self.game_data.get('current_bet', 0)
+        current_bet = game_data.get('current_bet', 0)
         my_chips = my_data.get('chips', 0)
         my_current_bet = my_data.get('current_bet', 0)
         
-        min_raise_increment = self.game_data.get('big_blind', 20)
+        min_raise_increment = game_data.get('big_blind', 20)
         min_total_raise_amount = current_bet + min_raise_increment
 
         # Player can only raise up to their total chips (current chips + chips already bet this round)
@@ -636,7 +813,7 @@ class PokerClient:
         }
         
         try:
-            self.socket.send(json.dumps(message).encode('utf-8') + b'\n') # Add newline for server parsing
+            self._send_json(message)
         except Exception as e:
             print(f"Error starting game: {e}")
             self.connected = False # Assume disconnection
@@ -655,6 +832,7 @@ class PokerClient:
             pass # Allow graceful exit on Ctrl+C
         finally:
             if self.connected and self.socket:
+                self.connected = False # Lets the listener thread exit at its next select timeout
                 self.socket.close()
 
 if __name__ == '__main__':
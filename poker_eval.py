@@ -0,0 +1,160 @@
+"""
+Perfect-hash poker hand evaluator. Cards are encoded as integers by encode_card();
+hands rank from 1 (royal flush) to 7462 (7-5-4-3-2 high card), lower is better.
+"""
+from typing import List, Dict, Tuple
+from itertools import combinations, islice
+from math import comb
+
+# Prime assigned to each rank index (2 -> 0 ... ace -> 12); a hand's rank multiset is the product of its primes
+PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+SUIT_BITS = {'spade': 1, 'heart': 2, 'diamond': 4, 'club': 8}
+
+def encode_card(rank_idx: int, suit_bit: int) -> int:
+    """
+    Integer encoding of one card:
+    bits 16-28 rank bit, 12-15 suit bit, 8-11 rank index, 0-7 rank prime.
+    """
+    return (1 << (rank_idx + 16)) | (suit_bit << 12) | (rank_idx << 8) | PRIMES[rank_idx]
+
+def _prime_product(rank_bits: int) -> int:
+    """Product of the rank primes for every rank bit set in rank_bits."""
+    product = 1
+    for rank_idx in range(13):
+        if rank_bits & (1 << rank_idx):
+            product *= PRIMES[rank_idx]
+    return product
+
+# 13-bit rank masks of every straight, from ace-high down to the wheel (A-2-3-4-5)
+STRAIGHT_MASKS = tuple(0b1111100000000 >> i for i in range(9)) + (0b1000000001111,)
+
+def _build_lookup_tables() -> Tuple[Dict[int, int], Dict[int, int]]:
+    """
+    Builds the perfect-hash tables for 5-card hands, ranking all 7462 distinct hands
+    from 1 (royal flush) to 7462 (7-5-4-3-2 high card).
+    flush_lookup is keyed by the 13-bit rank mask of a flush, unsuited_lookup by the
+    product of the five rank primes.
+    """
+    flush_lookup = {}
+    unsuited_lookup = {}
+    ranks_desc = list(range(12, -1, -1))
+
+    straights = STRAIGHT_MASKS
+    # Every other set of five distinct ranks, best first (a higher mask is a better hand)
+    no_pairs = sorted((sum(1 << r for r in combo) for combo in combinations(range(13), 5)), reverse=True)
+    no_pairs = [bits for bits in no_pairs if bits not in straights]
+
+    for i, bits in enumerate(straights):
+        flush_lookup[bits] = 1 + i # Straight flushes: 1-10
+        unsuited_lookup[_prime_product(bits)] = 1600 + i # Straights: 1600-1609
+    for i, bits in enumerate(no_pairs):
+        flush_lookup[bits] = 323 + i # Flushes: 323-1599
+        unsuited_lookup[_prime_product(bits)] = 6186 + i # High cards: 6186-7462
+
+    rank = 11 # Four of a kind: 11-166
+    for quad in ranks_desc:
+        for kicker in ranks_desc:
+            if kicker != quad:
+                unsuited_lookup[PRIMES[quad] ** 4 * PRIMES[kicker]] = rank
+                rank += 1
+
+    rank = 167 # Full house: 167-322
+    for trips in ranks_desc:
+        for pair in ranks_desc:
+            if pair != trips:
+                unsuited_lookup[PRIMES[trips] ** 3 * PRIMES[pair] ** 2] = rank
+                rank += 1
+
+    rank = 1610 # Three of a kind: 1610-2467
+    for trips in ranks_desc:
+        for k1, k2 in combinations([r for r in ranks_desc if r != trips], 2):
+            unsuited_lookup[PRIMES[trips] ** 3 * PRIMES[k1] * PRIMES[k2]] = rank
+            rank += 1
+
+    rank = 2468 # Two pair: 2468-3325
+    for high_pair, low_pair in combinations(ranks_desc, 2):
+        for kicker in ranks_desc:
+            if kicker != high_pair and kicker != low_pair:
+                unsuited_lookup[PRIMES[high_pair] ** 2 * PRIMES[low_pair] ** 2 * PRIMES[kicker]] = rank
+                rank += 1
+
+    rank = 3326 # One pair: 3326-6185
+    for pair in ranks_desc:
+        for k1, k2, k3 in combinations([r for r in ranks_desc if r != pair], 3):
+            unsuited_lookup[PRIMES[pair] ** 2 * PRIMES[k1] * PRIMES[k2] * PRIMES[k3]] = rank
+            rank += 1
+
+    return flush_lookup, unsuited_lookup
+
+FLUSH_LOOKUP, UNSUITED_LOOKUP = _build_lookup_tables()
+WORST_HAND_RANK = 7462
+
+# Upper rank bound of each hand category, mapped to the 0 (high card) - 9 (royal flush) categories
+_HAND_CATEGORY_LIMITS = ((1, 9), (10, 8), (166, 7), (322, 6), (1599, 5), (1609, 4), (2467, 3), (3325, 2), (6185, 1))
+
+# Display name of each hand category, indexed by hand_category()
+HAND_RANK_NAMES = ("High Card", "One Pair", "Two Pair", "Three of a Kind", "Straight",
+                   "Flush", "Full House", "Four of a Kind", "Straight Flush", "Royal Flush")
+
+def hand_category(hand_rank: int) -> int:
+    """Maps a hand rank from evaluate_hand (1 = best) to its category, 0 = High Card up to 9 = Royal Flush."""
+    for limit, category in _HAND_CATEGORY_LIMITS:
+        if hand_rank <= limit:
+            return category
+    return 0
+
+def _flush_rank(card_ints: List[int]) -> int:
+    """
+    Returns the rank of the best flush or straight flush among the encoded cards,
+    or WORST_HAND_RANK if no suit has five cards. Seven cards holding a flush cannot
+    also hold four of a kind or a full house, so a flush found here is the best hand.
+    """
+    suit_ranks = {}
+    for c in card_ints:
+        suit = c & 0xF000
+        suit_ranks[suit] = suit_ranks.get(suit, 0) | c >> 16
+    for rank_bits in suit_ranks.values():
+        if rank_bits.bit_count() >= 5:
+            for mask in STRAIGHT_MASKS:
+                if rank_bits & mask == mask:
+                    return FLUSH_LOOKUP[mask]
+            while rank_bits.bit_count() > 5:
+                rank_bits &= rank_bits - 1 # Drop the lowest rank of the suit
+            return FLUSH_LOOKUP[rank_bits]
+    return WORST_HAND_RANK
+
+def _unsuited_rank(five_card_sets, best: int = WORST_HAND_RANK) -> int:
+    """Returns the best (lowest) non-flush rank among an iterable of 5-card tuples of encoded cards, starting from best."""
+    for c1, c2, c3, c4, c5 in five_card_sets:
+        rank = UNSUITED_LOOKUP[(c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)]
+        if rank < best:
+            best = rank
+    return best
+
+def eval_7cards(card_ints: List[int]) -> int:
+    """Returns the best 5-card rank among five or more encoded cards."""
+    flush_rank = _flush_rank(card_ints)
+    if flush_rank != WORST_HAND_RANK:
+        return flush_rank
+    return _unsuited_rank(combinations(card_ints, 5))
+
+def eval_batch(hole_cards: List[List[int]], board: List[int]) -> List[int]:
+    """
+    Ranks several hands that share the same board, in the order of hole_cards.
+    The board is ranked once; per hand only the 5-card sets that use at least
+    one hole card are evaluated.
+    """
+    # A flush board gives every hand a flush, so the board only needs its non-flush rank
+    board_rank = _unsuited_rank(combinations(board, 5))
+    board_only = comb(len(board), 5)
+    ranks = []
+    for hole in hole_cards:
+        hand = hole + board
+        flush_rank = _flush_rank(hand)
+        if flush_rank != WORST_HAND_RANK:
+            ranks.append(flush_rank)
+            continue
+        # Sets made only of board cards come last in combinations() order and were ranked above
+        with_hole_cards = comb(len(hand), 5) - board_only
+        ranks.append(_unsuited_rank(islice(combinations(hand, 5), with_hole_cards), board_rank))
+    return ranks
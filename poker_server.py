@@ -1,11 +1,56 @@
 import socket
-import threading
+import asyncio
 import json
 import random
-from enum import Enum
-from dataclasses import dataclass, asdict
+import logging
+import logging.handlers
+import queue
+from collections import deque
+from enum import Enum, IntEnum
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Tuple
-import time
+from poker_eval import HAND_RANK_NAMES, SUIT_BITS, encode_card, eval_7cards, eval_batch, hand_category
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# _dumps_line encodes one message as newline-terminated JSON bytes, the wire framing clients expect
+try:
+    import orjson # Optional: faster JSON codec that reads and writes bytes directly
+    _loads = orjson.loads
+    def _dumps_line(obj):
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    _loads = json.loads
+    def _dumps_line(obj):
+        return (json.dumps(obj) + '\n').encode('utf-8')
+
+# Fixed framing around the encoded state of a game_update; only the payloads are encoded per broadcast
+_UPDATE_PREFIX = b'{"type":"game_update","data":'
+_PRIVATE_CARDS_PREFIX = b',"private":{"cards":'
+_UPDATE_END = b'}\n'
+_PRIVATE_UPDATE_END = b'}}\n'
+
+# Fixed replies, encoded once at import
+_JOIN_SUCCESS = _dumps_line({'type': 'join_success', 'message': 'Joined game successfully'})
+_JOIN_FAILED = _dumps_line({'type': 'join_failed', 'message': 'Game is full'})
+_JOIN_INVALID = _dumps_line({'type': 'join_failed', 'message': 'player_id and name must be non-empty strings'})
+_START_FAILED = _dumps_line({'type': 'error', 'message': 'Failed to start game'})
+_CANNOT_START = _dumps_line({'type': 'error', 'message': 'Cannot start game (not enough players or game already in progress)'})
+_INVALID_ACTION = _dumps_line({'type': 'action_failed', 'message': 'Invalid action or amount. Please check your input and current game state.'})
+_NOT_YOUR_TURN = _dumps_line({'type': 'action_failed', 'message': 'Not your turn. Please wait for your turn.'})
+_ACTIONS_NOT_ALLOWED = _dumps_line({'type': 'action_failed', 'message': 'Actions not allowed in current game state.'})
+
+try:
+    import uvloop # Optional: faster drop-in replacement for the asyncio event loop
+    if hasattr(uvloop, 'run'):
+        _run = uvloop.run
+    else: # uvloop.run only exists from uvloop 0.18; older releases install their loop policy instead
+        def _run(main):
+            uvloop.install()
+            return asyncio.run(main)
+except ImportError:
+    _run = asyncio.run
 
 class GameState(Enum):
     WAITING = "waiting"
@@ -17,28 +62,45 @@ class GameState(Enum):
     SHOWDOWN = "showdown"
     GAME_OVER = "game_over"
 
-class ActionType(Enum):
-    FOLD = "fold"
-    CHECK = "check"
-    CALL = "call"
-    RAISE = "raise"
-    ALL_IN = "all_in"
+# States in which players take betting actions
+_BETTING_STATES = frozenset((GameState.PRE_FLOP, GameState.FLOP, GameState.TURN, GameState.RIVER))
 
-@dataclass
+class ActionType(IntEnum):
+    FOLD = 0
+    CHECK = 1
+    CALL = 2
+    RAISE = 3
+    ALL_IN = 4
+
+# Action names as sent by clients ("fold", "all_in", ...) -> ActionType
+_ACTION_NAMES = {action.name.lower(): action for action in ActionType}
+
+# Ranks from lowest to highest
+RANK_ORDER = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'jack', 'queen', 'king', 'ace']
+_RANK_VALUES = {rank: i + 2 for i, rank in enumerate(RANK_ORDER)} # '2' -> 2 ... 'ace' -> 14
+
+@dataclass(slots=True, frozen=True)
 class Card:
+    """A playing card. Cards are immutable and hashable so the ALL_CARDS pool can be shared by every hand."""
     suit: str  # hearts, diamonds, clubs, spades
     rank: str  # 2-10, jack, queen, king, ace
+    value: int = field(init=False, repr=False, compare=False) # 2-14, derived from rank
+    image: str = field(init=False, repr=False, compare=False) # Image file name used by the client
+    _int: int = field(init=False, repr=False, compare=False) # Evaluator encoding
+    _json_text: str = field(init=False, repr=False, compare=False) # JSON object sent to clients for this card
     
     def __post_init__(self):
+        # The dataclass is frozen, so normalized and derived fields are written with object.__setattr__
+        rank = self.rank
         # Map rank names to match your image files
-        if self.rank == "J":
-            self.rank = "jack"
-        elif self.rank == "Q":
-            self.rank = "queen"
-        elif self.rank == "K":
-            self.rank = "king"
-        elif self.rank == "A":
-            self.rank = "ace"
+        if rank == "J":
+            rank = "jack"
+        elif rank == "Q":
+            rank = "queen"
+        elif rank == "K":
+            rank = "king"
+        elif rank == "A":
+            rank = "ace"
         
         # Map suit names to match your image files
         suit_mapping = {
@@ -47,21 +109,35 @@ class Card:
             "clubs": "club",
             "spades": "spade"
         }
-        if self.suit in suit_mapping:
-            self.suit = suit_mapping[self.suit]
-    
-    def get_image_name(self):
-        return f"{self.suit}_{self.rank}.jpg"
-    
-    def get_value(self):
-        if self.rank in ['jack', 'queen', 'king']:
-            return {'jack': 11, 'queen': 12, 'king': 13}[self.rank]
-        elif self.rank == 'ace':
-            return 14
-        else:
-            return int(self.rank)
+        suit = suit_mapping.get(self.suit, self.suit)
+        object.__setattr__(self, 'rank', rank)
+        object.__setattr__(self, 'suit', suit)
+        
+        # Computed once here rather than on every access
+        value = _RANK_VALUES[rank]
+        object.__setattr__(self, 'value', value)
+        object.__setattr__(self, 'image', f"{suit}_{rank}.jpg")
+        object.__setattr__(self, '_json_text', json.dumps({'suit': suit, 'rank': rank, 'image': self.image}, separators=(',', ':')))
+        
+        # Integer encoding used by the hand evaluator
+        object.__setattr__(self, '_int', encode_card(value - 2, SUIT_BITS[suit]))
+
+# Sent in place of each hole card a client is not allowed to see
+_HIDDEN_CARD_TEXT = '{"suit":"back","rank":"back","image":"card_back.jpg"}'
+
+# The 52 cards are built once; a hand's deck is a random order of indices into this tuple
+ALL_CARDS: Tuple[Card, ...] = tuple(Card(suit, rank) for suit in ('hearts', 'diamonds', 'clubs', 'spades') for rank in RANK_ORDER)
+_CARD_INTS: Tuple[int, ...] = tuple(card._int for card in ALL_CARDS) # Evaluator encoding by ALL_CARDS index
+_DECK_INDICES = list(range(len(ALL_CARDS)))
 
-@dataclass
+# Dedicated generator for shuffling, independent of the global random module state
+_RNG = random.Random()
+
+def _drop_bit(mask: int, bit: int) -> int:
+    """Removes one bit from a seat mask, shifting the higher seats down by one."""
+    return (mask & ((1 << bit) - 1)) | ((mask >> (bit + 1)) << bit)
+
+@dataclass(slots=True)
 class Player:
     id: str
     name: str
@@ -71,8 +147,8 @@ class Player:
     total_bet: int # Total amount player has put into the pot for the entire hand
     is_folded: bool
     is_all_in: bool
-    connection: socket.socket
-    has_acted_this_round: bool = False # Track if player has acted in current betting round
+    connection: asyncio.StreamWriter
+    card_idx: bytearray = field(default_factory=bytearray) # ALL_CARDS indices of the hole cards, parallel to cards
     
     def can_act(self):
         """Determines if a player is eligible to make an action."""
@@ -82,7 +158,9 @@ class PokerGame:
     def __init__(self):
         self.players: Dict[str, Player] = {}
         self.community_cards: List[Card] = []
-        self.deck: List[Card] = []
+        self.board_idx = bytearray() # ALL_CARDS indices of the community cards, parallel to community_cards
+        self._deck_order: List[int] = [] # Shuffled indices into ALL_CARDS for the current hand
+        self._deck_ptr = 0 # Position of the next card to deal in _deck_order
         self.pot = 0
         self.current_bet = 0 # Highest bet placed by any player in the current betting round
         self.dealer_position = -1 # Index in the list of active players for the dealer button
@@ -92,17 +170,52 @@ class PokerGame:
         self.big_blind = 20
         self.action_history = []
         self.last_raiser = None # Tracks the ID of the last player who made a raise in the current round
+        self.hand_ranks: Dict[str, int] = {} # Hand rank of each player evaluated by the last determine_winners
+        self._action_handlers = {
+            ActionType.FOLD: self._fold,
+            ActionType.CHECK: self._check,
+            ActionType.CALL: self._call,
+            ActionType.RAISE: self._raise,
+            ActionType.ALL_IN: self._all_in,
+        }
+        self._pids: tuple = () # Seat order of player ids, rebuilt only when players join or leave
+        self._plist: tuple = () # Player objects in the same order as _pids
+        self._json_ids: tuple = () # JSON-encoded player ids in the same order as _pids
+        self._json_heads: tuple = () # Encoded '"<id>":{"name":<name>' opening of each player's state entry
+        self._acted_mask = 0 # Bit i set: seat i has acted since the last bet or raise this round
+        self._active_mask = 0 # Bit i set: seat i can still act this hand (not folded, all-in or out of chips)
+
+    def _rebuild_index(self):
+        """Refreshes the cached seat-ordered player id and player tuples from self.players."""
+        self._pids = tuple(self.players)
+        self._plist = tuple(self.players.values())
+        self._json_ids = tuple(json.dumps(pid) for pid in self._pids)
+        self._json_heads = tuple(f'{json_id}:{{"name":{json.dumps(player.name)}' for json_id, player in zip(self._json_ids, self._plist))
         
     def create_deck(self):
-        """Creates and shuffles a standard 52-card deck."""
-        suits = ['hearts', 'diamonds', 'clubs', 'spades']
-        ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'jack', 'queen', 'king', 'ace']
-        self.deck = [Card(suit, rank) for suit in suits for rank in ranks]
-        random.shuffle(self.deck)
+        """Shuffles a standard 52-card deck as a random order of ALL_CARDS indices."""
+        self._deck_order = _DECK_INDICES.copy()
+        _RNG.shuffle(self._deck_order)
+        self._deck_ptr = 0
+
+    def deal_card(self, cards: List[Card], card_idx: bytearray):
+        """
+        Deals the next card from the deck onto a card list and its parallel index bytearray.
+        A hand uses at most 2 * 6 hole cards + 3 burns + 5 board cards.
+        """
+        index = self._deck_order[self._deck_ptr]
+        self._deck_ptr += 1
+        card_idx.append(index)
+        cards.append(ALL_CARDS[index])
     
-    def add_player(self, player_id: str, name: str, connection: socket.socket):
+    def add_player(self, player_id: str, name: str, connection: asyncio.StreamWriter):
         """Adds a new player to the game if there's space."""
+        if not (isinstance(player_id, str) and player_id and isinstance(name, str)):
+            return False # Player ids are the keys of the game-state JSON, which must be strings
         if len(self.players) < 6:  # Max 6 players
+            # Someone sitting down during a hand was not dealt in; they sit it out as folded
+            # (and outside the seat masks) until start_new_hand resets them
+            hand_in_progress = self.game_state not in (GameState.WAITING, GameState.GAME_OVER)
             self.players[player_id] = Player(
                 id=player_id,
                 name=name,
@@ -110,69 +223,87 @@ class PokerGame:
                 cards=[],
                 current_bet=0,
                 total_bet=0,
-                is_folded=False,
+                is_folded=hand_in_progress,
                 is_all_in=False,
                 connection=connection
             )
+            self._rebuild_index()
             return True
         return False
     
     def remove_player(self, player_id: str):
         """Removes a player from the game."""
         if player_id in self.players:
+            seat = self._pids.index(player_id)
             del self.players[player_id]
+            self._rebuild_index()
+            # Later seats shifted down by one; keep the turn and dealer indices on the same players
+            num_players = len(self._pids)
+            if self.current_player_index > seat:
+                self.current_player_index -= 1
+            if self.current_player_index >= num_players:
+                self.current_player_index = 0 if num_players else -1
+            if self.dealer_position > seat:
+                self.dealer_position -= 1
+            if self.dealer_position >= num_players:
+                self.dealer_position = num_players - 1
+            self._acted_mask = _drop_bit(self._acted_mask, seat)
+            self._active_mask = _drop_bit(self._active_mask, seat)
             # If less than 2 players remain and game is not waiting, end the game
-            if len([p for p in self.players.values() if p.chips > 0]) < 2 and self.game_state != GameState.WAITING:
+            if sum(1 for p in self._plist if p.chips > 0) < 2 and self.game_state != GameState.WAITING:
                 self.game_state = GameState.GAME_OVER
     
     def start_new_hand(self):
         """Starts a new hand of poker."""
-        active_players_in_game = [p for p in self.players.values() if p.chips > 0]
+        active_players_in_game = [p for p in self._plist if p.chips > 0]
         if len(active_players_in_game) < 2:
-            print("Not enough active players to start a new hand.")
+            logger.info("Not enough active players to start a new hand.")
             self.game_state = GameState.WAITING
             return False
             
         self.create_deck()
         self.community_cards = []
+        self.board_idx = bytearray()
         self.pot = 0
         self.current_bet = 0
         self.action_history = []
         self.last_raiser = None
 
         # Rotate dealer position to the next active player
-        players_ids = list(self.players.keys())
+        players_ids = self._pids
+        players_list = self._plist
+        num_players = len(players_ids)
         # Find the index of the next active player after the current dealer
         next_dealer_found = False
-        for i in range(len(players_ids)):
-            potential_dealer_index = (self.dealer_position + 1 + i) % len(players_ids)
-            potential_dealer_id = players_ids[potential_dealer_index]
-            if self.players[potential_dealer_id].chips > 0: # Only active players can be dealer
+        for i in range(num_players):
+            potential_dealer_index = (self.dealer_position + 1 + i) % num_players
+            if players_list[potential_dealer_index].chips > 0: # Only active players can be dealer
                 self.dealer_position = potential_dealer_index
                 next_dealer_found = True
                 break
         if not next_dealer_found: # Should not happen if len(active_players_in_game) >= 2
-            print("Error: Could not find a new dealer.")
+            logger.error("Could not find a new dealer.")
             return False
 
         # Reset player states for the new hand
-        for player_id in players_ids:
-            player = self.players[player_id]
+        for player in players_list:
             player.cards = []
+            player.card_idx = bytearray()
             player.current_bet = 0
             player.total_bet = 0 # Reset total bet for the new hand
             player.is_folded = False
             player.is_all_in = False
-            player.has_acted_this_round = False # Reset for the new hand
 
         # Deal hole cards
         for _ in range(2):
-            for player_id in players_ids:
-                player = self.players[player_id]
-                if self.deck:
-                    player.cards.append(self.deck.pop())
+            for player in players_list:
+                self.deal_card(player.cards, player.card_idx)
         
         self.post_blinds()
+        self._active_mask = 0
+        for i, player in enumerate(players_list):
+            if player.can_act():
+                self._active_mask |= 1 << i
         self.game_state = GameState.PRE_FLOP
         
         # Determine who starts the pre-flop betting round (UTG, or player after Big Blind)
@@ -181,27 +312,27 @@ class PokerGame:
         if self.current_player_index == -1: # Fallback if no player found after BB (e.g., only 2 players)
              self.current_player_index = self._get_player_index_after_dealer(self.dealer_position, 0) # Start from player after dealer
              
-        print(f"New hand started. Dealer: {self.players[players_ids[self.dealer_position]].name}. First to act: {self.players[players_ids[self.current_player_index]].name}")
+        logger.info("New hand started. Dealer: %s. First to act: %s", players_list[self.dealer_position].name, players_list[self.current_player_index].name)
         return True
     
     def post_blinds(self):
         """Handles posting of small and big blinds."""
-        players_list = list(self.players.values())
-        players_ids = list(self.players.keys())
+        players_list = self._plist
+        num_players = len(players_list)
 
         # Small blind position: 1 after dealer
-        sb_pos_index = (self.dealer_position + 1) % len(players_ids)
-        sb_player = players_list[sb_pos_index]
+        sb_pos_index = (self.dealer_position + 1) % num_players
         
         # Big blind position: 2 after dealer
-        bb_pos_index = (self.dealer_position + 2) % len(players_ids)
-        bb_player = players_list[bb_pos_index]
+        bb_pos_index = (self.dealer_position + 2) % num_players
 
         # Handle cases with fewer than 3 players (e.g., heads-up)
-        if len(players_list) == 2:
+        if num_players == 2:
             # In heads-up, dealer is small blind, other player is big blind
-            sb_player = players_list[self.dealer_position]
-            bb_player = players_list[(self.dealer_position + 1) % len(players_list)]
+            sb_pos_index = self.dealer_position
+            bb_pos_index = (self.dealer_position + 1) % num_players
+        sb_player = players_list[sb_pos_index]
+        bb_player = players_list[bb_pos_index]
 
         # Small blind
         sb_amount = min(self.small_blind, sb_player.chips)
@@ -209,8 +340,7 @@ class PokerGame:
         sb_player.current_bet += sb_amount
         sb_player.total_bet += sb_amount
         self.pot += sb_amount
-        sb_player.has_acted_this_round = True # Blinds count as actions
-        print(f"{sb_player.name} posted Small Blind of ${sb_amount}")
+        logger.info("%s posted Small Blind of $%s", sb_player.name, sb_amount)
         
         # Big blind
         bb_amount = min(self.big_blind, bb_player.chips)
@@ -218,146 +348,170 @@ class PokerGame:
         bb_player.current_bet += bb_amount
         bb_player.total_bet += bb_amount
         self.pot += bb_amount
-        bb_player.has_acted_this_round = True # Blinds count as actions
-        print(f"{bb_player.name} posted Big Blind of ${bb_amount}")
+        logger.info("%s posted Big Blind of $%s", bb_player.name, bb_amount)
         
         self.current_bet = bb_player.current_bet
         self.last_raiser = bb_player.id # Big blind is the initial "raiser" for checking purposes
+        # Blinds count as actions, but a small blind below the big blind still has to act on it
+        self._acted_mask = 1 << bb_pos_index
+        if sb_player.current_bet >= self.current_bet:
+            self._acted_mask |= 1 << sb_pos_index
+
+    @property
+    def current_player_id(self) -> Optional[str]:
+        """Id of the player whose turn it is, or None when nobody is to act."""
+        if self.current_player_index == -1:
+            return None
+        return self._pids[self.current_player_index]
+
+    def _next_active_seat(self, seat: int) -> int:
+        """
+        Returns the first seat after the given one, wrapping around the table, whose
+        player can still act, or -1 if nobody can. Reads _active_mask instead of scanning players.
+        """
+        mask = self._active_mask
+        if not mask:
+            return -1
+        later_seats = mask >> (seat + 1)
+        if later_seats:
+            return seat + (later_seats & -later_seats).bit_length() # Lowest set bit above seat
+        return (mask & -mask).bit_length() - 1 # Wrap around to the lowest active seat
 
     def _get_player_index_after_dealer(self, start_pos: int, offset: int = 1) -> int:
         """
         Finds the index of the next active player to act, starting from an offset
         relative to a given starting position (e.g., dealer, small blind).
         """
-        players_ids = list(self.players.keys())
-        num_players = len(players_ids)
+        num_players = len(self._pids)
         if num_players == 0:
             return -1
 
         # Start checking from the player after the offset from the start_pos
         initial_index = (start_pos + offset) % num_players
-        
-        for i in range(num_players):
-            current_index = (initial_index + i) % num_players
-            player_id = players_ids[current_index]
-            if self.players[player_id].can_act():
-                return current_index
-        return -1 # No active players found
+        return self._next_active_seat(initial_index - 1)
     
     def process_action(self, player_id: str, action: str, amount: int = 0):
         """Processes a player's action (fold, check, call, raise, all-in)."""
         if player_id not in self.players:
-            print(f"Error: Player {player_id} not found.")
+            logger.warning("Player %s not found.", player_id)
             return False
             
         player = self.players[player_id]
-        if not player.can_act():
-            print(f"Error: Player {player.name} cannot act (folded, all-in, or no chips).")
+        seat = self._pids.index(player_id)
+        if not self._active_mask >> seat & 1: # The seat masks decide who is still in this hand
+            logger.warning("Player %s cannot act (folded, all-in, or no chips).", player.name)
             return False
 
         # Ensure it's the current player's turn
-        players_list = list(self.players.keys())
-        if self.current_player_index == -1 or players_list[self.current_player_index] != player_id:
-            print(f"Error: Not {player.name}'s turn. Current player is {players_list[self.current_player_index] if self.current_player_index != -1 else 'None'}.")
+        if self.current_player_id != player_id:
+            logger.warning("Not %s's turn. Current player is %s.", player.name, self.current_player_id)
             return False
 
-        player.has_acted_this_round = True # Mark player as having acted this round
-        
-        success = False
-        if action == ActionType.FOLD.value:
-            player.is_folded = True
-            success = True
-            print(f"{player.name} folds.")
-        elif action == ActionType.CHECK.value:
-            if self.current_bet > player.current_bet:
-                print(f"Error: {player.name} cannot check, current bet is ${self.current_bet} (player has ${player.current_bet}).")
-                return False  # Can't check if there's a bet to call
-            success = True
-            print(f"{player.name} checks.")
-        elif action == ActionType.CALL.value:
-            call_amount_needed = self.current_bet - player.current_bet
-            
-            if call_amount_needed <= 0: # Can't call if no bet to match
-                print(f"Error: {player.name} cannot call, no bet to match or already matched.")
-                return False
+        action_type = _ACTION_NAMES.get(action)
+        if action_type is None:
+            logger.warning("Unknown action %r from %s.", action, player.name)
+            return False
 
-            amount_to_add = min(call_amount_needed, player.chips)
-            
-            player.chips -= amount_to_add
-            player.current_bet += amount_to_add
-            player.total_bet += amount_to_add
-            self.pot += amount_to_add
-            
-            if player.chips == 0:
-                player.is_all_in = True
-                print(f"{player.name} calls ${amount_to_add} and goes ALL IN.")
-            else:
-                print(f"{player.name} calls ${amount_to_add}.")
-            success = True
-        elif action == ActionType.RAISE.value:
-            # 'amount' here is the total amount the player wants to bet (e.g., raise to $100)
-            if amount <= self.current_bet: # Raise must be higher than current bet
-                print(f"Error: Raise amount ${amount} is not higher than current bet ${self.current_bet}.")
-                return False
-
-            # Calculate the amount to add to their current bet to reach the 'amount'
-            amount_to_add = amount - player.current_bet
-            
-            if amount_to_add > player.chips: # Player cannot afford the full raise
-                amount_to_add = player.chips # Player goes all-in for remaining chips
-                amount = player.current_bet + amount_to_add # Adjust total amount to reflect all-in
-                player.is_all_in = True
-            
-            player.chips -= amount_to_add
-            player.current_bet += amount_to_add
-            player.total_bet += amount_to_add
-            self.pot += amount_to_add
+        seat_bit = 1 << seat
+        if not self._action_handlers[action_type](player, seat_bit, amount):
+            return False
+        self._acted_mask |= seat_bit # Mark player as having acted this round
+        self.action_history.append((player_id, action_type, amount))
+        return True
+
+    def _fold(self, player: Player, seat_bit: int, amount: int) -> bool:
+        player.is_folded = True
+        self._active_mask &= ~seat_bit
+        logger.info("%s folds.", player.name)
+        return True
+
+    def _check(self, player: Player, seat_bit: int, amount: int) -> bool:
+        if self.current_bet > player.current_bet:
+            logger.warning("%s cannot check, current bet is $%s (player has $%s).", player.name, self.current_bet, player.current_bet)
+            return False  # Can't check if there's a bet to call
+        logger.info("%s checks.", player.name)
+        return True
+
+    def _call(self, player: Player, seat_bit: int, amount: int) -> bool:
+        call_amount_needed = self.current_bet - player.current_bet
+        
+        if call_amount_needed <= 0: # Can't call if no bet to match
+            logger.warning("%s cannot call, no bet to match or already matched.", player.name)
+            return False
+
+        amount_to_add = min(call_amount_needed, player.chips)
+        
+        player.chips -= amount_to_add
+        player.current_bet += amount_to_add
+        player.total_bet += amount_to_add
+        self.pot += amount_to_add
+        
+        if player.chips == 0:
+            player.is_all_in = True
+            self._active_mask &= ~seat_bit
+            logger.info("%s calls $%s and goes ALL IN.", player.name, amount_to_add)
+        else:
+            logger.info("%s calls $%s.", player.name, amount_to_add)
+        return True
+
+    def _raise(self, player: Player, seat_bit: int, amount: int) -> bool:
+        # 'amount' here is the total amount the player wants to bet (e.g., raise to $100)
+        if amount <= self.current_bet: # Raise must be higher than current bet
+            logger.warning("Raise amount $%s is not higher than current bet $%s.", amount, self.current_bet)
+            return False
+
+        # Calculate the amount to add to their current bet to reach the 'amount'
+        amount_to_add = amount - player.current_bet
+        
+        if amount_to_add > player.chips: # Player cannot afford the full raise
+            amount_to_add = player.chips # Player goes all-in for remaining chips
+            amount = player.current_bet + amount_to_add # Adjust total amount to reflect all-in
+        
+        player.chips -= amount_to_add
+        player.current_bet += amount_to_add
+        player.total_bet += amount_to_add
+        self.pot += amount_to_add
+        if player.current_bet > self.current_bet: # A short all-in must not lower the bet to match
             self.current_bet = player.current_bet # New highest bet for the round
             self.last_raiser = player.id # Update last raiser
-            
-            if player.chips == 0:
-                player.is_all_in = True
-                print(f"{player.name} raises to ${amount} and goes ALL IN.")
-            else:
-                print(f"{player.name} raises to ${amount}.")
-            success = True
-
-            # Reset has_acted_this_round for players who need to act again (those who haven't matched new current_bet)
-            for pid, p in self.players.items():
-                if p.can_act() and p.id != player.id and p.current_bet < self.current_bet:
-                    p.has_acted_this_round = False
-        elif action == ActionType.ALL_IN.value:
-            all_in_amount = player.chips
-            
-            # The player's total bet for the round is their current bet + all_in_amount
-            player.current_bet += all_in_amount
-            player.total_bet += all_in_amount
-            player.chips = 0 # Chips become 0 after going all-in
+            # Everyone else has to act again on the new bet (the raiser's own bit is set by process_action)
+            self._acted_mask = 0
+        
+        if player.chips == 0:
             player.is_all_in = True
-            self.pot += all_in_amount
-            
-            if player.current_bet > self.current_bet:
-                self.current_bet = player.current_bet
-                self.last_raiser = player.id
-                # Reset has_acted_this_round for players who need to act again
-                for pid, p in self.players.items():
-                    if p.can_act() and p.id != player.id and p.current_bet < self.current_bet:
-                        p.has_acted_this_round = False
-
-            print(f"{player.name} goes ALL IN with ${all_in_amount}.")
-            success = True
-        
-        if success:
-            self.action_history.append((player_id, action, amount))
-        return success
+            self._active_mask &= ~seat_bit
+            logger.info("%s raises to $%s and goes ALL IN.", player.name, amount)
+        else:
+            logger.info("%s raises to $%s.", player.name, amount)
+        return True
+
+    def _all_in(self, player: Player, seat_bit: int, amount: int) -> bool:
+        all_in_amount = player.chips
+        
+        # The player's total bet for the round is their current bet + all_in_amount
+        player.current_bet += all_in_amount
+        player.total_bet += all_in_amount
+        player.chips = 0 # Chips become 0 after going all-in
+        player.is_all_in = True
+        self._active_mask &= ~seat_bit
+        self.pot += all_in_amount
+        
+        if player.current_bet > self.current_bet:
+            self.current_bet = player.current_bet
+            self.last_raiser = player.id
+            # Everyone else has to act again on the new bet (the raiser's own bit is set by process_action)
+            self._acted_mask = 0
+
+        logger.info("%s goes ALL IN with $%s.", player.name, all_in_amount)
+        return True
     
     def advance_to_next_street(self):
         """Advances the game to the next betting street (Flop, Turn, River, Showdown)."""
         # Collect all current_bets into the main pot and reset for the new street
-        for player in self.players.values():
+        for player in self._plist:
             self.pot += player.current_bet # Add current round's bets to main pot
             player.current_bet = 0
-            player.has_acted_this_round = False # Reset for the new street
+        self._acted_mask = 0 # Nobody has acted yet on the new street
         self.current_bet = 0 # Reset current bet for the new street
         self.last_raiser = None # Reset last raiser for the new street
 
@@ -368,142 +522,61 @@ class PokerGame:
         # If no active player found after dealer (e.g., all others folded/all-in),
         # try to find the first active player in the player list.
         if self.current_player_index == -1:
-            players_ids = list(self.players.keys())
-            for i in range(len(players_ids)):
-                if self.players[players_ids[i]].can_act():
-                    self.current_player_index = i
-                    break
+            self.current_player_index = self._next_active_seat(-1) # Lowest seat still in _active_mask
             # If still no active player, it means all remaining players are all-in or folded.
             # In this case, the betting round implicitly completes, and we move to showdown if it's river.
-            if self.current_player_index == -1 and any(p.chips > 0 and not p.is_folded for p in self.players.values()):
-                print("Warning: No active player found to start new street, but some players still have chips and are not folded.")
+            if self.current_player_index == -1 and any(p.chips > 0 and not p.is_folded for p in self._plist):
+                logger.warning("No active player found to start new street, but some players still have chips and are not folded.")
                 # This might happen if all remaining players are all-in.
                 # The game should proceed to dealing cards and then to showdown if it's the river.
                 pass # Let the game state advance and game_loop handle the next step
 
         if self.game_state == GameState.PRE_FLOP:
             # Deal flop (3 cards)
-            self.deck.pop()  # Burn card
+            self._deck_ptr += 1  # Burn card
             for _ in range(3):
-                if self.deck:
-                    self.community_cards.append(self.deck.pop())
+                self.deal_card(self.community_cards, self.board_idx)
             self.game_state = GameState.FLOP
-            print("--- FLOP dealt ---")
+            logger.info("--- FLOP dealt ---")
         elif self.game_state == GameState.FLOP:
             # Deal turn (1 card)
-            self.deck.pop()  # Burn card
-            if self.deck:
-                self.community_cards.append(self.deck.pop())
+            self._deck_ptr += 1  # Burn card
+            self.deal_card(self.community_cards, self.board_idx)
             self.game_state = GameState.TURN
-            print("--- TURN dealt ---")
+            logger.info("--- TURN dealt ---")
         elif self.game_state == GameState.TURN:
             # Deal river (1 card)
-            self.deck.pop()  # Burn card
-            if self.deck:
-                self.community_cards.append(self.deck.pop())
+            self._deck_ptr += 1  # Burn card
+            self.deal_card(self.community_cards, self.board_idx)
             self.game_state = GameState.RIVER
-            print("--- RIVER dealt ---")
+            logger.info("--- RIVER dealt ---")
         elif self.game_state == GameState.RIVER:
             self.game_state = GameState.SHOWDOWN
-            print("--- SHOWDOWN ---")
-
-    def evaluate_hand(self, player_cards: List[Card], community_cards: List[Card]) -> Tuple[int, List[int]]:
-        """Evaluate poker hand strength. Returns (hand_rank, tiebreakers)"""
-        all_cards = player_cards + community_cards
-        all_cards.sort(key=lambda x: x.get_value(), reverse=True)
-        
-        # Count suits and ranks
-        suits = {}
-        ranks = {}
-        for card in all_cards:
-            suits[card.suit] = suits.get(card.suit, 0) + 1
-            ranks[card.get_value()] = ranks.get(card.get_value(), 0) + 1
-        
-        # Check for flush
-        is_flush = any(count >= 5 for count in suits.values())
-        
-        # Check for straight
-        unique_ranks = sorted(list(set(card.get_value() for card in all_cards)), reverse=True)
-        is_straight = False
-        straight_high = 0
-        
-        # Check for regular straight
-        for i in range(len(unique_ranks) - 4):
-            if unique_ranks[i] - unique_ranks[i+4] == 4:
-                is_straight = True
-                straight_high = unique_ranks[i]
-                break
-        
-        # Check for A-2-3-4-5 straight (wheel)
-        if not is_straight and 14 in unique_ranks and 2 in unique_ranks and 3 in unique_ranks and 4 in unique_ranks and 5 in unique_ranks:
-            is_straight = True
-            straight_high = 5
-        
-        # Count pairs, trips, quads
-        # Convert to list of (rank, count) tuples for easier processing of counts
-        rank_counts = sorted(ranks.items(), key=lambda x: (x[1], x[0]), reverse=True)
-        
-        # Determine hand ranking (higher number = better hand)
-        if is_straight and is_flush:
-            # Check for royal flush specifically (10-J-Q-K-A of same suit)
-            if all(r in unique_ranks for r in [10, 11, 12, 13, 14]) and is_flush and straight_high == 14:
-                return (9, [14]) # Royal Flush
-            else: # Straight Flush
-                # Find the highest card of the straight flush
-                flush_suit = None
-                for suit, count in suits.items():
-                    if count >= 5:
-                        flush_suit = suit
-                        break
-                
-                straight_flush_cards = sorted([card.get_value() for card in all_cards if card.suit == flush_suit], reverse=True)
-                for i in range(len(straight_flush_cards) - 4):
-                    if straight_flush_cards[i] - straight_flush_cards[i+4] == 4:
-                        return (8, [straight_flush_cards[i]])
-                # Handle A-5 straight flush
-                if 14 in straight_flush_cards and 5 in straight_flush_cards and 4 in straight_flush_cards and 3 in straight_flush_cards and 2 in straight_flush_cards:
-                    return (8, [5])
-                return (0, [0]) # Should not happen if logic is correct
-                
-        elif rank_counts[0][1] == 4:  # Four of a kind
-            return (7, [rank_counts[0][0], rank_counts[1][0]]) # Quad rank, then kicker
-        elif rank_counts[0][1] == 3 and rank_counts[1][1] >= 2:  # Full house (at least a pair for the second part)
-            # Ensure we pick the highest pair if there are multiple
-            pair_rank = 0
-            for i in range(1, len(rank_counts)):
-                if rank_counts[i][1] >= 2:
-                    pair_rank = rank_counts[i][0]
-                    break
-            return (6, [rank_counts[0][0], pair_rank])
-        elif is_flush:  # Flush
-            flush_suit = None
-            for suit, count in suits.items():
-                if count >= 5:
-                    flush_suit = suit
-                    break
-            flush_cards = sorted([card.get_value() for card in all_cards if card.suit == flush_suit], reverse=True)[:5]
-            return (5, flush_cards)
-        elif is_straight:  # Straight
-            return (4, [straight_high])
-        elif rank_counts[0][1] == 3:  # Three of a kind
-            kickers = sorted([rank for rank, count in rank_counts if count == 1], reverse=True)[:2]
-            return (3, [rank_counts[0][0]] + kickers)
-        elif rank_counts[0][1] == 2 and rank_counts[1][1] == 2:  # Two pair
-            # Ensure pairs are in descending order
-            pairs = sorted([rank_counts[0][0], rank_counts[1][0]], reverse=True)
-            kicker = sorted([rank for rank, count in rank_counts if count == 1], reverse=True)
-            return (2, pairs + (kicker[:1] if kicker else []))
-        elif rank_counts[0][1] == 2:  # One pair
-            kickers = sorted([rank for rank, count in rank_counts if count == 1], reverse=True)[:3]
-            return (1, [rank_counts[0][0]] + kickers)
-        else:  # High card
-            return (0, sorted([card.get_value() for card in all_cards], reverse=True)[:5])
+            logger.info("--- SHOWDOWN ---")
+
+    def evaluate_hand(self, player_cards: List[Card], community_cards: List[Card]) -> int:
+        """
+        Evaluate poker hand strength as the best 5-card rank among the given cards.
+        Returns 1 (royal flush) to 7462 (worst high card); lower is better.
+        """
+        return eval_7cards([card._int for card in player_cards + community_cards])
+
+    def evaluate_hands_batch(self, hole_cards: Dict[str, bytes], board_idx: bytes) -> Dict[str, int]:
+        """
+        Evaluate several players' hands against the same community cards in one pass.
+        Cards are given as ALL_CARDS indices (Player.card_idx, board_idx).
+        Returns player_id -> hand rank.
+        """
+        card_ints = _CARD_INTS
+        ranks = eval_batch([[card_ints[i] for i in card_idx] for card_idx in hole_cards.values()], [card_ints[i] for i in board_idx])
+        return dict(zip(hole_cards, ranks))
 
     def determine_winners(self) -> List[str]:
         """Determine the winner(s) of the hand considering side pots."""
         # Active players are those who haven't folded
         potential_winners = {pid: p for pid, p in self.players.items() if not p.is_folded}
         
+        self.hand_ranks = {}
         if len(potential_winners) == 0:
             return [] # No winners, perhaps all folded before blinds were paid
         
@@ -511,36 +584,42 @@ class PokerGame:
             # If only one player left, they win the entire pot
             winner_id = list(potential_winners.keys())[0]
             self.players[winner_id].chips += self.pot
-            print(f"Player {self.players[winner_id].name} wins the entire pot of ${self.pot} (all others folded).")
+            logger.info("Player %s wins the entire pot of $%s (all others folded).", self.players[winner_id].name, self.pot)
             self.pot = 0
             return [winner_id]
 
-        player_hands = {}        
-        for pid, player in potential_winners.items():
-            hand_strength = self.evaluate_hand(player.cards, self.community_cards)
-            player_hands[pid] = hand_strength
+        player_hands = self.evaluate_hands_batch({pid: player.card_idx for pid, player in potential_winners.items()}, self.board_idx)
+        self.hand_ranks = player_hands
         
-        # Calculate side pots
-        # Collect all unique total_bet amounts in ascending order from players who are still in the hand
-        all_bets = sorted(list(set(p.total_bet for p in potential_winners.values())), reverse=False)
-        
-        # Initialize side pots
+        # Calculate side pots in one sweep over the bet levels of players still in the hand.
+        # Every chip put in this hand counts, including chips from players who later folded.
+        live_players = sorted(potential_winners.values(), key=lambda p: p.total_bet)
+        contributions = sorted(p.total_bet for p in self._plist if p.total_bet > 0)
+        num_contributions = len(contributions)
         side_pots = []
-        for i, bet_level in enumerate(all_bets):
-            eligible_players_for_this_level = [p for p in potential_winners.values() if p.total_bet >= bet_level]
-            if not eligible_players_for_this_level:
+        prev_level = 0
+        next_contribution = 0 # Contributions before this index ended below the current level
+        first_eligible = 0 # live_players before this index are capped below the current level
+        for player in live_players:
+            bet_level = player.total_bet
+            if bet_level == prev_level:
                 continue
-
             pot_amount_for_level = 0
-            # Calculate the contribution to this specific bet level
-            contribution_per_player = bet_level - (all_bets[i-1] if i > 0 else 0)
-            
-            for player in eligible_players_for_this_level:
-                # Add player's contribution to this side pot, capped at their total bet for this level
-                player_contribution_to_level = min(contribution_per_player, player.total_bet - (all_bets[i-1] if i > 0 else 0))
-                pot_amount_for_level += player_contribution_to_level
-            
-            side_pots.append({'amount': pot_amount_for_level, 'eligible_players': [p.id for p in eligible_players_for_this_level]})
+            while next_contribution < num_contributions and contributions[next_contribution] < bet_level:
+                pot_amount_for_level += contributions[next_contribution] - prev_level
+                next_contribution += 1
+            pot_amount_for_level += (bet_level - prev_level) * (num_contributions - next_contribution)
+            while live_players[first_eligible].total_bet < bet_level:
+                first_eligible += 1
+            side_pots.append({'amount': pot_amount_for_level, 'eligible_players': [p.id for p in live_players[first_eligible:]]})
+            prev_level = bet_level
+        # Folded players who put in more than any remaining player: that excess goes to the last pot
+        dead_money = sum(contributions[next_contribution:]) - prev_level * (num_contributions - next_contribution)
+        if dead_money:
+            if side_pots:
+                side_pots[-1]['amount'] += dead_money
+            else:
+                side_pots.append({'amount': dead_money, 'eligible_players': [p.id for p in live_players]})
 
         final_winners = []
         
@@ -550,12 +629,12 @@ class PokerGame:
             eligible_pids = pot_info['eligible_players']
             
             # Filter player hands for eligible players for THIS side pot
-            eligible_player_hands = {pid: strength for pid, strength in player_hands.items() if pid in eligible_pids}
+            eligible_player_hands = {pid: player_hands[pid] for pid in eligible_pids}
 
             if not eligible_player_hands:
                 continue
 
-            best_strength = max(eligible_player_hands.values())
+            best_strength = min(eligible_player_hands.values()) # Lower rank is the stronger hand
             current_pot_winners = [pid for pid, strength in eligible_player_hands.items() if strength == best_strength]
             
             # Distribute current_pot_amount among current_pot_winners
@@ -568,7 +647,7 @@ class PokerGame:
                     if idx < remainder: # Distribute remainder chips one by one
                         winnings += 1
                     self.players[winner_id].chips += winnings
-                    print(f"Player {self.players[winner_id].name} wins ${winnings} from a side pot.")
+                    logger.info("Player %s wins $%s from a side pot.", self.players[winner_id].name, winnings)
                     if winner_id not in final_winners:
                         final_winners.append(winner_id)
             
@@ -576,132 +655,247 @@ class PokerGame:
 
         return final_winners
     
-    def get_game_state(self, player_id: Optional[str] = None) -> dict:
+    def encode_common_state(self) -> bytes:
         """
-        Returns the current game state, with player-specific card visibility.
-        If player_id is provided, their cards are shown. During SHOWDOWN, all cards are shown.
+        Encodes the part of the game state that every client sees. Hole cards are hidden
+        behind card backs, except during SHOWDOWN when all cards are shown.
+        The shape is fixed, so only the changing values are formatted; player ids, names
+        and cards come pre-encoded. tests/test_game_state.py checks it against a dict-built oracle.
         """
-        players_data = {}
-        players_list = list(self.players.keys())
-        
-        for pid, player in self.players.items():
-            player_cards_data = []
-            # Reveal cards only to the specific player or during showdown
-            if player_id == pid or self.game_state == GameState.SHOWDOWN:
-                player_cards_data = [{'suit': card.suit, 'rank': card.rank, 'image': card.get_image_name()} for card in player.cards]
-            else: # Other players' cards are hidden
-                for _ in player.cards: # Still send 2 card objects, but with back image
-                    player_cards_data.append({'suit': 'back', 'rank': 'back', 'image': 'card_back.jpg'})
-
-            players_data[pid] = {
-                'name': player.name,
-                'chips': player.chips,
-                'current_bet': player.current_bet,
-                'total_bet': player.total_bet,
-                'is_folded': player.is_folded,
-                'is_all_in': player.is_all_in,
-                'cards': player_cards_data,
-                'is_current_player': (players_list[self.current_player_index] == pid) if self.current_player_index != -1 else False
-            }
-        
-        return {
-            'game_state': self.game_state.value,
-            'players': players_data,
-            'community_cards': [{'suit': card.suit, 'rank': card.rank, 'image': card.get_image_name()} for card in self.community_cards],
-            'pot': self.pot,
-            'current_bet': self.current_bet,
-            'current_player_id': players_list[self.current_player_index] if self.current_player_index != -1 else None,
-            'dealer_player_id': players_list[self.dealer_position] if self.dealer_position != -1 else None,
-            'small_blind': self.small_blind, # Send blind amounts to client for raise calculation
-            'big_blind': self.big_blind
-        }
+        reveal_all = self.game_state == GameState.SHOWDOWN
+        json_ids = self._json_ids
+        current_index = self.current_player_index
+        players_text = []
+        for seat, (head, player) in enumerate(zip(self._json_heads, self._plist)):
+            if reveal_all:
+                cards_text = ','.join([card._json_text for card in player.cards])
+            else: # Still send one card object per hole card, but with the back image
+                cards_text = ','.join([_HIDDEN_CARD_TEXT] * len(player.cards))
+            players_text.append(
+                f'{head},"chips":{player.chips},"current_bet":{player.current_bet},"total_bet":{player.total_bet},'
+                f'"is_folded":{"true" if player.is_folded else "false"},"is_all_in":{"true" if player.is_all_in else "false"},'
+                f'"cards":[{cards_text}],"is_current_player":{"true" if seat == current_index else "false"}}}'
+            )
+        community_text = ','.join([card._json_text for card in self.community_cards])
+        current_player_text = json_ids[current_index] if current_index != -1 else 'null'
+        dealer_text = json_ids[self.dealer_position] if self.dealer_position != -1 else 'null'
+        return (
+            f'{{"game_state":"{self.game_state.value}","players":{{{",".join(players_text)}}},'
+            f'"community_cards":[{community_text}],"pot":{self.pot},"current_bet":{self.current_bet},'
+            f'"current_player_id":{current_player_text},"dealer_player_id":{dealer_text},'
+            f'"small_blind":{self.small_blind},"big_blind":{self.big_blind}}}'
+        ).encode('utf-8')
+
+    def encode_private_cards(self, player_id: Optional[str]) -> Optional[bytes]:
+        """
+        Encodes the hole cards that only player_id may see, or returns None when the common
+        state already shows everything they are allowed to see (no cards, or SHOWDOWN).
+        """
+        player = self.players.get(player_id)
+        if player is None or not player.cards or self.game_state == GameState.SHOWDOWN:
+            return None
+        return f'[{",".join([card._json_text for card in player.cards])}]'.encode('utf-8')
+
+def _start_queue_logging(level: int) -> Tuple[logging.handlers.QueueListener, logging.Handler]:
+    """
+    Routes this module's log records through a queue so console writes happen on a listener thread.
+    Returns the listener and the handler added to the logger; _stop_queue_logging undoes both.
+    """
+    log_queue = queue.SimpleQueue()
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, console)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+    logger.setLevel(level)
+    listener.start()
+    return listener, queue_handler
+
+def _stop_queue_logging(listener: logging.handlers.QueueListener, queue_handler: logging.Handler):
+    """Detaches the queue handler first, so nothing is queued after the listener's final drain."""
+    logger.removeHandler(queue_handler)
+    listener.stop()
 
 class PokerServer:
-    def __init__(self, host='0.0.0.0', port=8888):
+    def __init__(self, host='0.0.0.0', port=8888, log_level=logging.WARNING):
         self.host = host
         self.port = port
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.log_level = log_level
+        self.server: Optional[asyncio.AbstractServer] = None
         self.game = PokerGame()
-        self.clients: Dict[str, socket.socket] = {} # Map player_id to client socket
+        self.clients: Dict[str, asyncio.StreamWriter] = {} # Map player_id to client stream writer
+        self.send_queues: Dict[str, deque] = {} # Unsent (is_state, message) pairs per player, in send order
+        self.send_wakeups: Dict[str, asyncio.Event] = {} # Set when a player's send queue has something new
+        self.sender_tasks: Dict[str, asyncio.Task] = {} # Per-player task writing out the send queue
+        self.game_loop_task: Optional[asyncio.Task] = None
+        self.game_lock = asyncio.Lock() # Held while a client message or a game-loop tick changes the game
+        self._broadcast_scheduled = False # A game_update broadcast is queued for the next loop iteration
+        self._reaper_tasks = set() # Keeps pending _remove_players tasks referenced until they finish
+        self._next_hand_timer: Optional[asyncio.TimerHandle] = None # Set while a finished hand is on display
+        self._next_hand_task: Optional[asyncio.Task] = None
         
-    def start(self):
+    async def start(self):
         """Starts the poker server, listening for connections and running the game loop."""
-        self.socket.bind((self.host, self.port))
-        self.socket.listen(6)
+        self.server = await asyncio.start_server(self.handle_client, self.host, self.port, reuse_address=True, backlog=6)
         print(f"Poker server started on {self.host}:{self.port}")
         
-        # Start game logic loop in a separate thread
-        game_loop_thread = threading.Thread(target=self.game_loop)
-        game_loop_thread.daemon = True # Allow the main program to exit even if this thread is running
-        game_loop_thread.start()
+        # Game logic runs as a task on the same event loop as the client handlers
+        self.game_loop_task = asyncio.create_task(self.game_loop())
 
-        while True:
-            try:
-                client_socket, address = self.socket.accept()
-                print(f"New connection from {address}")
-                # Client handling thread is responsible for receiving messages from this client
-                client_thread = threading.Thread(
-                    target=self.handle_client,
-                    args=(client_socket, address)
-                )
-                client_thread.daemon = True
-                client_thread.start()
-            except Exception as e:
-                print(f"Error accepting connection: {e}")
+        log_listener, log_handler = _start_queue_logging(self.log_level)
+        try:
+            async with self.server:
+                await self.server.serve_forever()
+        finally:
+            self.game_loop_task.cancel()
+            _stop_queue_logging(log_listener, log_handler)
     
-    def handle_client(self, client_socket, address):
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
         """Handles incoming messages from a single client connection."""
+        address = writer.get_extra_info('peername')
+        logger.info("New connection from %s", address)
+        client_socket = writer.get_extra_info('socket')
+        if client_socket is not None:
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) # Send small action/state messages immediately
+            client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) # Let the OS detect dead peers
+            if hasattr(socket, 'TCP_QUICKACK'): # Linux only: ACK the client's join/actions without the delayed-ACK wait
+                client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
         player_id = None
         try:
             while True:
-                data = client_socket.recv(4096).decode('utf-8')
-                if not data:
-                    break # Client disconnected
+                try:
+                    line = await reader.readuntil(b'\n') # One newline-terminated JSON message
+                except asyncio.IncompleteReadError:
+                    break # Client disconnected (a partial trailing message is discarded)
                 
-                # Split data by newline to handle multiple JSON messages in one recv call
-                messages = data.split('\n')
-                for msg_str in messages:
-                    if msg_str.strip(): # Process non-empty strings
-                        try:
-                            message = json.loads(msg_str)
-                            # For 'join' message, we need to associate player_id with socket immediately
-                            if message.get('type') == 'join':
-                                player_id = message.get('player_id')
-                                player_name = message.get('name')
-                                if self.game.add_player(player_id, player_name, client_socket):
-                                    self.clients[player_id] = client_socket # Store the socket
-                                    response = {'type': 'join_success', 'message': 'Joined game successfully'}
-                                    self.send_to_client(player_id, response) # Send response directly
-                                    print(f"Player {player_name} ({player_id}) joined.")
-                                    self.broadcast_game_state() # Broadcast initial state to all
-                                else:
-                                    response = {'type': 'join_failed', 'message': 'Game is full'}
-                                    self.send_to_client(player_id, response)
-                                    print(f"Player {player_name} ({player_id}) failed to join: Game full.")
-                                continue # Skip further processing for join messages in this loop iteration
-
+                if not line.strip(): # Skip empty lines
+                    continue
+                async with self.game_lock:
+                    try:
+                        message = _loads(line) # Parsed straight from the reader's bytes, no decoded copy
+                        # For 'join' message, we need to associate player_id with the writer immediately
+                        if message.get('type') == 'join':
+                            join_id = message.get('player_id')
+                            player_name = message.get('name')
+                            # Player ids become object keys in every game_update, so only strings are accepted
+                            if not (isinstance(join_id, str) and join_id and isinstance(player_name, str)):
+                                writer.write(_JOIN_INVALID) # Not a client yet, so reply on the writer directly
+                                logger.warning("Rejected join from %s: invalid player_id %r or name %r.", address, join_id, player_name)
+                            elif self.game.add_player(join_id, player_name, writer):
+                                player_id = join_id
+                                self.clients[player_id] = writer # Store the writer
+                                self._start_sender(player_id, writer)
+                                self.send_raw_to_client(player_id, _JOIN_SUCCESS) # Send response directly
+                                logger.info("Player %s (%s) joined.", player_name, player_id)
+                                self.broadcast_game_state() # Broadcast initial state to all
+                            else:
+                                # Not a client either; player_id stays None so the cleanup below
+                                # cannot evict a seated player who happens to share join_id
+                                writer.write(_JOIN_FAILED)
+                                logger.warning("Player %s (%s) failed to join: Game full.", player_name, join_id)
+                        else:
                             # Process other messages using the game instance
                             self.process_client_message(message, player_id)
-                                
-                        except json.JSONDecodeError:
-                            print(f"Invalid JSON from {address}: {msg_str}")
-                        except Exception as e:
-                            print(f"Error processing message from {address}: {e}")
-                            self.send_to_client(player_id, {'type': 'error', 'message': f"Server error: {e}"})
+                        
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        logger.warning("Invalid JSON from %s: %r", address, line)
+                    except Exception as e:
+                        logger.error("Error processing message from %s: %s", address, e)
+                        self.send_to_client(player_id, {'type': 'error', 'message': f"Server error: {e}"})
                             
         except Exception as e:
-            print(f"Client handler error for {address}: {e}")
+            logger.error("Client handler error for %s: %s", address, e)
         finally:
             # Clean up on client disconnect
             if player_id:
-                print(f"Player {player_id} disconnected.")
-                self.game.remove_player(player_id)
-                if player_id in self.clients:
-                    del self.clients[player_id]
-                self.broadcast_game_state() # Update all clients after disconnect
-            client_socket.close()
+                logger.info("Player %s disconnected.", player_id)
+                async with self.game_lock:
+                    self.game.remove_player(player_id)
+                    self._forget_client(player_id)
+                    self.broadcast_game_state() # Update all clients after disconnect
+            writer.close()
     
+    def _start_sender(self, player_id: str, writer: asyncio.StreamWriter):
+        """Creates the player's send queue and the task that writes it out."""
+        self._stop_sender(player_id)
+        send_queue = deque()
+        wakeup = asyncio.Event()
+        self.send_queues[player_id] = send_queue
+        self.send_wakeups[player_id] = wakeup
+        self.sender_tasks[player_id] = asyncio.create_task(self._send_messages(send_queue, wakeup, writer))
+
+    def _stop_sender(self, player_id: str):
+        """Drops the player's unsent messages and cancels their sender task."""
+        self.send_queues.pop(player_id, None)
+        self.send_wakeups.pop(player_id, None)
+        sender_task = self.sender_tasks.pop(player_id, None)
+        if sender_task is not None:
+            sender_task.cancel()
+
+    async def _send_messages(self, send_queue: deque, wakeup: asyncio.Event, writer: asyncio.StreamWriter):
+        """
+        Writes everything queued for one client in a single writelines call, in queue order,
+        and waits for it to drain before taking the next batch. This is the only place a
+        client's backpressure is felt; other clients and the game loop never wait on it.
+        """
+        try:
+            while True:
+                await wakeup.wait()
+                wakeup.clear()
+                if writer.is_closing():
+                    break # The client's handler notices the closed connection and cleans up
+                messages = [message for _, message in send_queue]
+                send_queue.clear()
+                writer.writelines(messages)
+                # Most batches are written out inside writelines(); only wait when data is left over
+                if writer.transport.get_write_buffer_size():
+                    await writer.drain()
+        except (ConnectionError, OSError):
+            pass # The client's handler notices the closed connection and cleans up
+
+    def _forget_client(self, player_id: str):
+        """Removes a player's connection and unsent messages."""
+        if player_id in self.clients:
+            del self.clients[player_id]
+        self._stop_sender(player_id)
+
+    def _queue_message(self, player_id: str, message: bytes, is_state: bool = False):
+        """
+        Appends an encoded message to the player's send queue. A game_update replaces an unsent
+        one at the tail (latest wins), but never jumps ahead of a direct message queued before it.
+        """
+        send_queue = self.send_queues.get(player_id)
+        if send_queue is None:
+            return
+        if is_state and send_queue and send_queue[-1][0]:
+            send_queue[-1] = (True, message)
+        else:
+            send_queue.append((is_state, message))
+        self.send_wakeups[player_id].set()
+
+    def _flush_pending_state(self):
+        """Queues a scheduled game_update right away, so it stays ahead of the message about to be queued."""
+        if self._broadcast_scheduled:
+            self._send_game_state()
+
+    def _reap_clients(self, player_ids: List[str]):
+        """
+        Drops the connections of clients found dead while sending, then removes their
+        players from the game in one pass once game_lock is free.
+        """
+        for player_id in player_ids:
+            self._forget_client(player_id)
+        reaper = asyncio.get_running_loop().create_task(self._remove_players(player_ids))
+        self._reaper_tasks.add(reaper)
+        reaper.add_done_callback(self._reaper_tasks.discard)
+
+    async def _remove_players(self, player_ids: List[str]):
+        """Removes players whose connections broke and broadcasts the resulting state once."""
+        async with self.game_lock:
+            for player_id in player_ids:
+                self.game.remove_player(player_id) # No-op if their handler already removed them
+            self.broadcast_game_state()
+
     def process_client_message(self, message: dict, player_id: str):
         """Processes a message received from a client."""
         msg_type = message.get('type')
@@ -710,30 +904,27 @@ class PokerServer:
             # Only allow starting if in WAITING state and enough players
             if self.game.game_state == GameState.WAITING and len(self.game.players) >= 2:
                 if self.game.start_new_hand():
-                    print("Game started by a client.")
+                    logger.info("Game started by a client.")
                     self.broadcast_game_state()
                 else:
-                    print("Failed to start game.")
-                    self.send_to_client(player_id, {'type': 'error', 'message': 'Failed to start game'})
+                    logger.warning("Failed to start game.")
+                    self.send_raw_to_client(player_id, _START_FAILED)
             else:
-                self.send_to_client(player_id, {'type': 'error', 'message': 'Cannot start game (not enough players or game already in progress)'})
+                self.send_raw_to_client(player_id, _CANNOT_START)
         
         elif msg_type == 'action':
             action_type = message.get('action')
             amount = message.get('amount', 0)
             
             # Ensure actions are only processed during active betting rounds
-            if self.game.game_state in [GameState.PRE_FLOP, GameState.FLOP, GameState.TURN, GameState.RIVER]:
-                players_list = list(self.game.players.keys())
-                current_player_id = players_list[self.game.current_player_index] if self.game.current_player_index != -1 else None
-                
-                if player_id == current_player_id: # Check if it's the correct player's turn
+            if self.game.game_state in _BETTING_STATES:
+                if player_id == self.game.current_player_id: # Check if it's the correct player's turn
                     if self.game.process_action(player_id, action_type, amount):
-                        print(f"Player {self.game.players[player_id].name} took action: {action_type} {amount}")
+                        logger.debug("Player %s took action: %s %s", self.game.players[player_id].name, action_type, amount)
                         
                         # After processing action, determine next step: round complete or next player's turn
                         if self.is_betting_round_complete():
-                            print(f"Betting round for {self.game.game_state.value} is complete after {self.game.players[player_id].name}'s action.")
+                            logger.debug("Betting round for %s is complete after %s's action.", self.game.game_state.value, self.game.players[player_id].name)
                             self.game.advance_to_next_street()
                             # If advancing to showdown, handle it immediately
                             if self.game.game_state == GameState.SHOWDOWN:
@@ -743,11 +934,11 @@ class PokerServer:
                         
                         self.broadcast_game_state() # Broadcast after state change
                     else:
-                        self.send_to_client(player_id, {'type': 'action_failed', 'message': 'Invalid action or amount. Please check your input and current game state.'})
+                        self.send_raw_to_client(player_id, _INVALID_ACTION)
                 else:
-                    self.send_to_client(player_id, {'type': 'action_failed', 'message': 'Not your turn. Please wait for your turn.'})
+                    self.send_raw_to_client(player_id, _NOT_YOUR_TURN)
             else:
-                self.send_to_client(player_id, {'type': 'action_failed', 'message': 'Actions not allowed in current game state.'})
+                self.send_raw_to_client(player_id, _ACTIONS_NOT_ALLOWED)
         
         # Add other message types as needed
     
@@ -756,175 +947,141 @@ class PokerServer:
         Checks if the current betting round is complete.
         A round is complete if:
         1. Only one player remains active (others folded).
-        2. All active players have matched the highest bet (current_bet) and have acted this round,
-           or are all-in.
+        2. Every player who can still act has acted since the last bet or raise and
+           matched the highest bet (current_bet). All-in players need no further action.
         """
-        active_players_in_round = [p for p in self.game.players.values() if p.can_act()]
-        
-        if len(active_players_in_round) <= 1: # All but one folded, or no active players left
+        active_mask = self.game._active_mask
+        if active_mask & (active_mask - 1) == 0: # All but one folded or all-in, or no active players left
             return True
-            
-        # Check if all active players have either matched the highest bet or are all-in
-        # and have acted since the last raise (or initial post-blinds for pre-flop)
-        for player in active_players_in_round:
-            # If a player is not all-in, they must have matched the current bet AND acted this round
-            if not player.is_all_in:
-                if player.current_bet < self.game.current_bet or not player.has_acted_this_round:
-                    return False
-            # If a player is all-in, they are considered to have completed their action for the round.
-            # No further action is required from them.
-        
-        # Additional check: If the last raiser is the only one who has acted,
-        # and everyone else has called or folded, the round is complete.
-        # This prevents the round from looping back to the raiser unnecessarily.
-        if self.game.last_raiser:
-            raiser_player = self.game.players[self.game.last_raiser]
-            # If the raiser has acted, and all other active players have matched their bet
-            # and acted, the round is complete.
-            all_others_matched_and_acted = True
-            for player in active_players_in_round:
-                if player.id == self.game.last_raiser:
-                    continue # Skip the raiser for this check
-                if not player.is_all_in and (player.current_bet < self.game.current_bet or not player.has_acted_this_round):
-                    all_others_matched_and_acted = False
-                    break
-            if all_others_matched_and_acted:
-                return True
-
-        # If no one has raised (e.g., all checks/calls at current_bet 0), and everyone has acted, round is complete.
-        if self.game.current_bet == 0: # This implies no raises, only checks
-            if all(p.has_acted_this_round for p in active_players_in_round):
-                return True
-
-        return False
+        # Any bet above a player's current_bet clears every other acted bit, so an active player
+        # whose bit is set has matched the current bet
+        complete = self.game._acted_mask & active_mask == active_mask
+        if __debug__:
+            current_bet = self.game.current_bet # Checked over the same seats as the result: those in active_mask
+            assert not complete or all(p.current_bet >= current_bet for seat, p in enumerate(self.game._plist) if active_mask >> seat & 1), \
+                "betting round marked complete with an unmatched active player"
+        return complete
     
     def advance_to_next_player(self):
         """
         Advances the current_player_index to the next player who needs to act.
         This function is called after a player performs an action.
         """
-        players_list = list(self.game.players.keys())
-        num_players = len(players_list)
-        if num_players == 0:
-            self.game.current_player_index = -1
+        game = self.game
+        if not game._pids:
+            game.current_player_index = -1
             return
 
-        start_index = self.game.current_player_index # Remember who just acted
-        
-        # Loop through players starting from the one *after* the current one
+        # Walk the seats that can still act, starting after the one who just acted,
         # to find the next player who needs to act.
-        for _ in range(num_players): # Loop through all players once
-            self.game.current_player_index = (self.game.current_player_index + 1) % num_players
-            current_player_id = players_list[self.game.current_player_index]
-            player = self.game.players[current_player_id]
-
-            # A player needs to act if:
-            # 1. They are eligible to act (`can_act()`).
-            # 2. Their current bet is less than the highest bet (`self.game.current_bet`) OR
-            #    they haven't acted this round (e.g., after a raise by someone else).
-            if player.can_act() and (player.current_bet < self.game.current_bet or not player.has_acted_this_round):
-                print(f"Next turn: {player.name} ({current_player_id})")
+        seat = game.current_player_index
+        for _ in range(len(game._pids)):
+            seat = game._next_active_seat(seat)
+            if seat == -1:
+                break
+            player = game._plist[seat]
+
+            # A player needs to act if their current bet is less than the highest bet
+            # (`game.current_bet`) OR they haven't acted since the last bet or raise.
+            if player.current_bet < game.current_bet or not game._acted_mask >> seat & 1:
+                game.current_player_index = seat
+                logger.debug("Next turn: %s (%s)", player.name, player.id)
                 return # Found the next player to act
         
         # If the loop finishes without returning, it implies no active player needs to act.
         # This means the betting round should be considered complete.
-        print("No active player found who needs to act. Betting round should be complete.")
+        logger.debug("No active player found who needs to act. Betting round should be complete.")
         # The game_loop will then detect this via is_betting_round_complete()
         # and advance the street.
         
-    def game_loop(self):
+    async def game_loop(self):
         """The main server-side game logic loop."""
         while True:
-            time.sleep(0.5) # Server tick rate
+            await asyncio.sleep(0.5) # Server tick rate
 
-            # State: WAITING - Wait for clients to join and a 'start_game' message
-            if self.game.game_state == GameState.WAITING:
-                # Game start is usually triggered by a client, so keep waiting here
-                pass
+            # Client messages wait while a tick runs, including its showdown/winner pauses
+            async with self.game_lock:
+                # State: WAITING - Wait for clients to join and a 'start_game' message
+                if self.game.game_state == GameState.WAITING:
+                    # Game start is usually triggered by a client, so keep waiting here
+                    pass
             
-            # States: PRE_FLOP, FLOP, TURN, RIVER - Betting rounds
-            elif self.game.game_state in [GameState.PRE_FLOP, GameState.FLOP, GameState.TURN, GameState.RIVER]:
-                # The primary role here is to check for round completion.
-                # Player turns are advanced by process_client_message after an action.
-                if self.is_betting_round_complete():
-                    print(f"Betting round for {self.game.game_state.value} is complete (via game_loop check).")
-                    self.game.advance_to_next_street()
-                    self.broadcast_game_state()
-                    # If it's showdown after advancing, handle it
-                    if self.game.game_state == GameState.SHOWDOWN:
-                        self.handle_showdown()
-                # Else, if round is not complete, we simply wait for a client action.
-                # The turn advancement is handled by process_client_message.
+                # States: PRE_FLOP, FLOP, TURN, RIVER - Betting rounds
+                elif self.game.game_state in _BETTING_STATES:
+                    # The primary role here is to check for round completion.
+                    # Player turns are advanced by process_client_message after an action.
+                    if self.is_betting_round_complete():
+                        logger.debug("Betting round for %s is complete (via game_loop check).", self.game.game_state.value)
+                        self.game.advance_to_next_street()
+                        self.broadcast_game_state()
+                        # If it's showdown after advancing, handle it
+                        if self.game.game_state == GameState.SHOWDOWN:
+                            self.handle_showdown()
+                    # Else, if round is not complete, we simply wait for a client action.
+                    # The turn advancement is handled by process_client_message.
             
-            # State: SHOWDOWN - Determine winners and distribute pot
-            elif self.game.game_state == GameState.SHOWDOWN:
-                self.handle_showdown() # Ensure showdown logic runs
-                time.sleep(5) # Allow clients to see showdown results
-                # Reset has_acted_this_round for all players for the new hand
-                for player in self.game.players.values():
-                    player.has_acted_this_round = False
-                self.game.start_new_hand()
-                self.broadcast_game_state()
+                # State: SHOWDOWN - Determine winners and distribute pot
+                elif self.game.game_state == GameState.SHOWDOWN:
+                    if self._next_hand_timer is None: # No one has handled this showdown yet
+                        self.handle_showdown() # Ensure showdown logic runs
                 
-            # State: GAME_OVER - Not enough players or game ended
-            elif self.game.game_state == GameState.GAME_OVER:
-                print("Game is over. Waiting for players to join/restart.")
-                # Logic to reset game or wait for more players
-                pass
-
-            # Check if only one player remains active in a hand (others folded)
-            # This check should be done continuously during active game states
-            active_players_in_hand = [p for p in self.game.players.values() if not p.is_folded and p.chips > 0]
-            if self.game.game_state not in [GameState.WAITING, GameState.GAME_OVER, GameState.SHOWDOWN] and len(active_players_in_hand) == 1:
-                winner_id = active_players_in_hand[0].id
-                # Ensure pot is correctly assigned if others folded
-                self.game.players[winner_id].chips += self.game.pot
-                print(f"All players folded except {self.game.players[winner_id].name}. They win the pot of ${self.game.pot}.")
-                self.game.pot = 0
-                self.game.game_state = GameState.SHOWDOWN # Transition to showdown to trigger pot distribution/new hand
-                self.broadcast_game_state()
-                time.sleep(2) # Short delay to show winner
-                # Reset has_acted_this_round for all players for the new hand
-                for player in self.game.players.values():
-                    player.has_acted_this_round = False
-                self.game.start_new_hand()
-                self.broadcast_game_state()
+                # State: GAME_OVER - Not enough players or game ended
+                elif self.game.game_state == GameState.GAME_OVER:
+                    logger.info("Game is over. Waiting for players to join/restart.")
+                    # Logic to reset game or wait for more players
+                    pass
+
+                # Check if only one player remains active in a hand (others folded)
+                # This check should be done continuously during active game states
+                if self.game.game_state in _BETTING_STATES:
+                    active_players_in_hand = [p for p in self.game._plist if not p.is_folded and p.chips > 0]
+                else:
+                    active_players_in_hand = ()
+                if len(active_players_in_hand) == 1:
+                    winner_id = active_players_in_hand[0].id
+                    # Ensure pot is correctly assigned if others folded
+                    self.game.players[winner_id].chips += self.game.pot
+                    logger.info("All players folded except %s. They win the pot of $%s.", self.game.players[winner_id].name, self.game.pot)
+                    self.game.pot = 0
+                    self.game.game_state = GameState.SHOWDOWN # Transition to showdown to trigger pot distribution/new hand
+                    self.broadcast_game_state()
+                    self._schedule_next_hand(2) # Short delay to show winner
+
+    def _schedule_next_hand(self, delay: float):
+        """Deals the next hand after `delay` seconds; the game loop and clients keep running meanwhile."""
+        self._next_hand_timer = asyncio.get_running_loop().call_later(delay, self._on_next_hand_timer)
+
+    def _on_next_hand_timer(self):
+        self._next_hand_task = asyncio.create_task(self._start_next_hand())
+
+    async def _start_next_hand(self):
+        """Starts a new hand once the finished one has been shown, under game_lock like any other change."""
+        async with self.game_lock:
+            self._next_hand_timer = None
+            self.game.start_new_hand()
+            self.broadcast_game_state()
 
 
 # In PokerServer.handle_showdown method:
     def handle_showdown(self):
-        print("Handling showdown...")
+        logger.debug("Handling showdown...")
         winners = self.game.determine_winners()
+        self.broadcast_game_state() # Revealed cards and payouts reach clients before the game_result
         
         winning_hand_type = "No Winner" # Default
         if winners:
-            # Assuming determine_winners returns the best hand strength for the winner(s)
-            # You'll need to re-evaluate the hand for the winner(s) to get the hand type string
-            # Or, modify determine_winners to return the hand type directly.
-            
-            # For simplicity, let's assume the first winner's hand type is representative
-            # A more robust solution would store winning hand type for each winner during determine_winners
+            # For simplicity, let's assume the first winner's hand type is representative.
+            # determine_winners already ranked every contested hand in one batch, so reuse that
             first_winner_id = winners[0]
-            winner_player = self.game.players[first_winner_id]
-            hand_strength_tuple = self.game.evaluate_hand(winner_player.cards, self.game.community_cards)
+            hand_rank = self.game.hand_ranks.get(first_winner_id)
+            if hand_rank is None: # Won without a contested showdown, so no hand was evaluated
+                winner_player = self.game.players[first_winner_id]
+                hand_rank = self.game.evaluate_hand(winner_player.cards, self.game.community_cards)
             
-            # Map hand_rank (integer) to string
-            hand_rank_map = {
-                9: "Royal Flush",
-                8: "Straight Flush",
-                7: "Four of a Kind",
-                6: "Full House",
-                5: "Flush",
-                4: "Straight",
-                3: "Three of a Kind",
-                2: "Two Pair",
-                1: "One Pair",
-                0: "High Card"
-            }
-            winning_hand_type = hand_rank_map.get(hand_strength_tuple[0], "Unknown Hand")
+            winning_hand_type = HAND_RANK_NAMES[hand_category(hand_rank)]
 
             winner_names = [self.game.players[pid].name for pid in winners]
-            print(f"Winners of the hand: {', '.join(winner_names)} with a {winning_hand_type}")
+            logger.info("Winners of the hand: %s with a %s", ', '.join(winner_names), winning_hand_type)
             
             winning_message = {
                 'type': 'game_result',
@@ -932,54 +1089,70 @@ class PokerServer:
                 'message': f"The winner(s) are: {', '.join(winner_names)}!",
                 'winning_hand_type': winning_hand_type # <-- This is the new field
             }
-            self.broadcast(json.dumps(winning_message).encode('utf-8') + b'\n')
+            self.broadcast(_dumps_line(winning_message))
         else:
-            print("No winners determined (e.g., all folded before showdown).")
+            logger.info("No winners determined (e.g., all folded before showdown).")
         
-        self.broadcast_game_state()
+        # The pending timer also marks this showdown as handled, so the game loop does not pay it out again
+        self._schedule_next_hand(5) # Allow clients to see showdown results
         
     def send_to_client(self, player_id: str, message: dict):
         """Sends a JSON message to a specific client."""
         if player_id in self.clients:
-            try:
-                self.clients[player_id].send(json.dumps(message).encode('utf-8') + b'\n') # Add newline for client parsing
-            except Exception as e:
-                print(f"Error sending message to client {player_id}: {e}")
+            self._flush_pending_state()
+            self._queue_message(player_id, _dumps_line(message))
+
+    def send_raw_to_client(self, player_id: str, message: bytes):
+        """Sends an already encoded, newline-terminated message to a specific client."""
+        if player_id in self.clients:
+            self._flush_pending_state()
+            self._queue_message(player_id, message)
 
     def broadcast_game_state(self):
+        """
+        Marks the game state as changed. All changes made before control returns to the
+        event loop (e.g. action, street advance, deal) go out as a single broadcast.
+        """
+        if not self._broadcast_scheduled:
+            self._broadcast_scheduled = True
+            asyncio.get_running_loop().call_soon(self._send_game_state)
+
+    def _send_game_state(self):
         """Broadcasts the current game state to all connected clients, with player-specific card visibility."""
-        # Send individual game state to each player (revealing their own cards)
-        for player_id, client_socket in list(self.clients.items()):
+        if not self._broadcast_scheduled:
+            return # Already sent early by _flush_pending_state
+        self._broadcast_scheduled = False
+        # Encode the shared state once; each player's own hole cards are sent alongside it in
+        # 'private', and the client puts them into its entry in data['players']
+        message_head = _UPDATE_PREFIX + self.game.encode_common_state()
+        common_message = message_head + _UPDATE_END # For every client with nothing private to see
+        dead = []
+        for player_id, writer in self.clients.items():
             try:
-                game_state_for_player = self.game.get_game_state(player_id)
-                message = json.dumps({
-                    'type': 'game_update',
-                    'data': game_state_for_player
-                })
-                client_socket.send(message.encode('utf-8') + b'\n') # Add newline
+                if writer.is_closing():
+                    raise ConnectionResetError("connection closed")
+                private_cards = self.game.encode_private_cards(player_id)
+                if private_cards is None:
+                    message = common_message
+                else:
+                    message = b''.join((message_head, _PRIVATE_CARDS_PREFIX, private_cards, _PRIVATE_UPDATE_END))
+                self._queue_message(player_id, message, is_state=True)
             except Exception as e:
-                print(f"Error broadcasting game state to {player_id}: {e}")
-                # Remove disconnected client
-                if player_id in self.clients:
-                    del self.clients[player_id]
-                self.game.remove_player(player_id) # Remove player from game if connection breaks
+                logger.warning("Error broadcasting game state to %s: %s", player_id, e)
+                dead.append(player_id) # Removed after the loop, without mutating self.clients mid-iteration
+        if dead:
+            self._reap_clients(dead)
     
     def broadcast(self, message: bytes):
         """Broadcasts a raw byte message to all connected clients."""
-        for player_id, client_socket in list(self.clients.items()):
-            try:
-                client_socket.send(message)
-            except Exception as e:
-                print(f"Error broadcasting to {player_id}: {e}")
-                if player_id in self.clients:
-                    del self.clients[player_id]
-                self.game.remove_player(player_id)
+        self._flush_pending_state()
+        for player_id in self.clients:
+            self._queue_message(player_id, message)
 
 if __name__ == '__main__':
     server = PokerServer()
     try:
-        server.start()
+        _run(server.start())
     except KeyboardInterrupt:
         print("\nServer shutting down...")
-        server.socket.close()
 
@@ -0,0 +1,82 @@
+import asyncio
+
+from poker_server import GameState, PokerServer
+
+
+def _check_or_call(game) -> tuple:
+    player_id = game.current_player_id
+    player = game.players[player_id]
+    return player_id, 'call' if player.current_bet < game.current_bet else 'check'
+
+
+async def _join_mid_hand_then_finish_preflop():
+    server = PokerServer()
+    game = server.game
+    game.add_player('alice-id', 'alice', None)
+    game.add_player('bob-id', 'bob', None)
+    game.start_new_hand()
+    game.add_player('carol-id', 'carol', None) # Sits down after the cards were dealt
+
+    while game.game_state == GameState.PRE_FLOP:
+        player_id, action = _check_or_call(game)
+        server.process_client_message({'type': 'action', 'action': action, 'amount': 0}, player_id)
+    assert game.game_state == GameState.FLOP
+
+
+def test_betting_round_completes_after_a_mid_hand_join():
+    asyncio.run(_join_mid_hand_then_finish_preflop())
+
+
+def test_mid_hand_joiner_sits_out_until_the_next_hand():
+    server = PokerServer()
+    game = server.game
+    game.add_player('alice-id', 'alice', None)
+    game.add_player('bob-id', 'bob', None)
+    game.start_new_hand()
+    game.add_player('carol-id', 'carol', None)
+
+    carol = game.players['carol-id']
+    assert carol.is_folded and not carol.cards
+    assert not game._active_mask >> 2 & 1
+    assert not game.process_action('carol-id', 'check')
+
+    game.start_new_hand()
+    assert not carol.is_folded and len(carol.cards) == 2
+    assert game._active_mask >> 2 & 1
+
+
+async def _play_hand_with_mid_hand_joiner():
+    server = PokerServer()
+    game = server.game
+    for name in ('alice', 'bob', 'carol'):
+        game.add_player(f'{name}-id', name, None)
+    game.start_new_hand()
+    game.add_player('dave-id', 'dave', None)
+
+    while game.game_state not in (GameState.SHOWDOWN, GameState.WAITING):
+        player_id, action = _check_or_call(game)
+        assert player_id != 'dave-id'
+        server.process_client_message({'type': 'action', 'action': action, 'amount': 0}, player_id)
+        # Each street's first player is picked by advance_to_next_street, then each turn by advance_to_next_player
+        assert game.current_player_id != 'dave-id'
+    if server._next_hand_timer is not None:
+        server._next_hand_timer.cancel()
+
+
+def test_mid_hand_joiner_is_never_next_to_act():
+    asyncio.run(_play_hand_with_mid_hand_joiner())
+
+
+def test_street_fallback_skips_seats_outside_the_hand():
+    server = PokerServer()
+    game = server.game
+    for name in ('alice', 'bob'):
+        game.add_player(f'{name}-id', name, None)
+    game.start_new_hand()
+    game.add_player('carol-id', 'carol', None)
+    game.players['carol-id'].is_folded = False # can_act() says yes, but carol was never dealt in
+    for player_id in ('alice-id', 'bob-id'): # Everyone in the hand is all-in, so nobody can act
+        game.players[player_id].is_all_in = True
+    game._active_mask = 0
+    game.advance_to_next_street()
+    assert game.current_player_id is None
@@ -0,0 +1,131 @@
+import asyncio
+import json
+
+from poker_server import GameState, PokerServer, _BETTING_STATES
+
+
+class _RecordingWriter:
+    """Stands in for a client's StreamWriter and keeps everything written to it."""
+
+    def __init__(self):
+        self.data = b''
+        self.transport = self
+
+    def get_write_buffer_size(self):
+        return 0
+
+    def is_closing(self):
+        return False
+
+    def write(self, data):
+        self.data += data
+
+    def writelines(self, chunks):
+        self.data += b''.join(chunks)
+
+    async def drain(self):
+        pass
+
+    def messages(self):
+        return [json.loads(line) for line in self.data.splitlines()]
+
+
+class _StalledWriter(_RecordingWriter):
+    """A client whose TCP window stays full: data sits in the buffer and drain() never returns."""
+
+    def get_write_buffer_size(self):
+        return len(self.data)
+
+    async def drain(self):
+        await asyncio.get_running_loop().create_future()
+
+
+def _seat_players(server: PokerServer, stalled: tuple = ()) -> dict:
+    writers = {}
+    for name in ('alice', 'bob', 'carol'):
+        player_id = f'{name}-id'
+        writers[player_id] = _StalledWriter() if player_id in stalled else _RecordingWriter()
+        server.game.add_player(player_id, name, writers[player_id])
+        server.clients[player_id] = writers[player_id]
+        server._start_sender(player_id, writers[player_id])
+    return writers
+
+
+def _check_or_call(game) -> tuple:
+    player_id = game.current_player_id
+    player = game.players[player_id]
+    return player_id, 'call' if player.current_bet < game.current_bet else 'check'
+
+
+async def _run_game_loop(server: PokerServer, seconds: float):
+    loop_task = asyncio.create_task(server.game_loop())
+    await asyncio.sleep(seconds)
+    assert not loop_task.done() # A tick that raised would end the loop silently
+    loop_task.cancel()
+    if server._next_hand_timer is not None:
+        server._next_hand_timer.cancel()
+
+
+def _assert_result_follows_showdown_state(writer: _RecordingWriter):
+    types_and_states = [(message['type'], message.get('data', {}).get('game_state')) for message in writer.messages()]
+    result_at = types_and_states.index(('game_result', None))
+    assert ('game_update', GameState.SHOWDOWN.value) in types_and_states[:result_at]
+
+
+async def _play_to_showdown_then_tick():
+    server = PokerServer()
+    game = server.game
+    writers = _seat_players(server)
+    game.start_new_hand()
+
+    # Everyone calls or checks until the river action ends the hand inside process_client_message
+    while game.game_state in _BETTING_STATES:
+        player_id, action = _check_or_call(game)
+        server.process_client_message({'type': 'action', 'action': action, 'amount': 0}, player_id)
+    assert game.game_state == GameState.SHOWDOWN
+    chips_after_showdown = {player_id: player.chips for player_id, player in game.players.items()}
+
+    # A couple of game-loop ticks during the showdown pause must not pay the pot out again
+    await _run_game_loop(server, 1.2)
+
+    assert {player_id: player.chips for player_id, player in game.players.items()} == chips_after_showdown
+    for writer in writers.values():
+        assert [message['type'] for message in writer.messages()].count('game_result') == 1
+        _assert_result_follows_showdown_state(writer)
+
+
+async def _finish_river_then_tick(stalled: tuple = ()):
+    server = PokerServer()
+    game = server.game
+    writers = _seat_players(server, stalled)
+    game.start_new_hand()
+
+    # The last river action goes straight to the game, so the game loop is the one that ends the hand
+    while game.game_state in _BETTING_STATES:
+        player_id, action = _check_or_call(game)
+        if game.game_state == GameState.RIVER and len(game.community_cards) == 5 and not server.is_betting_round_complete():
+            game.process_action(player_id, action, 0)
+            if server.is_betting_round_complete():
+                break
+            server.advance_to_next_player()
+        else:
+            server.process_client_message({'type': 'action', 'action': action, 'amount': 0}, player_id)
+    assert game.game_state == GameState.RIVER
+
+    await _run_game_loop(server, 0.7)
+
+    for player_id, writer in writers.items():
+        if player_id not in stalled:
+            _assert_result_follows_showdown_state(writer)
+
+
+def test_showdown_from_an_action_is_handled_once():
+    asyncio.run(_play_to_showdown_then_tick())
+
+
+def test_game_result_follows_the_showdown_update_from_the_game_loop():
+    asyncio.run(_finish_river_then_tick())
+
+
+def test_a_stalled_client_does_not_hold_up_the_game_loop():
+    asyncio.run(_finish_river_then_tick(stalled=('bob-id',)))
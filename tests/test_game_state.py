@@ -0,0 +1,149 @@
+import asyncio
+import json
+import random
+
+from poker_server import GameState, PokerGame, PokerServer, _BETTING_STATES
+
+
+def _random_table(rng: random.Random) -> PokerGame:
+    game = PokerGame()
+    for i in range(rng.randint(0, 6)):
+        # Quotes, backslashes and non-ASCII text must survive the pre-encoded ids and names
+        game.add_player(f'p"{i}\\é', f'Näme "{i}"', None)
+    if rng.random() < 0.8:
+        game.start_new_hand()
+    for _ in range(rng.randint(0, 4)):
+        if game.game_state in _BETTING_STATES:
+            game.advance_to_next_street()
+    if game._plist and rng.random() < 0.3:
+        game._plist[0].is_folded = True
+        game._plist[-1].is_all_in = True
+    if game._pids and rng.random() < 0.3:
+        game.remove_player(game._pids[0])
+    return game
+
+
+def _card_dict(card) -> dict:
+    return {'suit': card.suit, 'rank': card.rank, 'image': card.image}
+
+
+def _build_common_state(game: PokerGame) -> dict:
+    """Reference for encode_common_state, built from plain dicts."""
+    reveal_all = game.game_state == GameState.SHOWDOWN
+    hidden_card = {'suit': 'back', 'rank': 'back', 'image': 'card_back.jpg'}
+    players_data = {}
+    for pid, player in zip(game._pids, game._plist):
+        players_data[pid] = {
+            'name': player.name,
+            'chips': player.chips,
+            'current_bet': player.current_bet,
+            'total_bet': player.total_bet,
+            'is_folded': player.is_folded,
+            'is_all_in': player.is_all_in,
+            'cards': [_card_dict(card) if reveal_all else hidden_card for card in player.cards],
+            'is_current_player': pid == game.current_player_id,
+        }
+    return {
+        'game_state': game.game_state.value,
+        'players': players_data,
+        'community_cards': [_card_dict(card) for card in game.community_cards],
+        'pot': game.pot,
+        'current_bet': game.current_bet,
+        'current_player_id': game.current_player_id,
+        'dealer_player_id': game._pids[game.dealer_position] if game.dealer_position != -1 else None,
+        'small_blind': game.small_blind,
+        'big_blind': game.big_blind,
+    }
+
+
+def test_encode_common_state_matches_build_common_state():
+    rng = random.Random(3)
+    for _ in range(300):
+        game = _random_table(rng)
+        assert json.loads(game.encode_common_state()) == _build_common_state(game)
+        for pid, player in zip(game._pids, game._plist):
+            private_cards = game.encode_private_cards(pid)
+            if game.game_state == GameState.SHOWDOWN or not player.cards:
+                assert private_cards is None
+            else:
+                assert json.loads(private_cards) == [_card_dict(card) for card in player.cards]
+
+
+async def _read_message(reader: asyncio.StreamReader) -> dict:
+    return json.loads(await asyncio.wait_for(reader.readuntil(b'\n'), 2))
+
+
+async def _join_with_bad_ids():
+    server = PokerServer()
+    listener = await asyncio.start_server(server.handle_client, '127.0.0.1', 0)
+    port = listener.sockets[0].getsockname()[1]
+    try:
+        for bad_join in ({'player_id': 7, 'name': 'int id'},
+                         {'name': 'no id'},
+                         {'player_id': '', 'name': 'empty id'},
+                         {'player_id': 'bad-name', 'name': None}):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(json.dumps({'type': 'join', **bad_join}).encode() + b'\n')
+            assert (await _read_message(reader))['type'] == 'join_failed'
+            writer.close()
+        assert not server.game.players
+
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(json.dumps({'type': 'join', 'player_id': 'alice-id', 'name': 'alice'}).encode() + b'\n')
+        assert (await _read_message(reader))['type'] == 'join_success'
+        update = await _read_message(reader)
+        assert update['type'] == 'game_update'
+        assert list(update['data']['players']) == ['alice-id']
+        writer.close()
+    finally:
+        listener.close()
+        await listener.wait_closed()
+
+
+def test_join_rejects_non_string_ids():
+    asyncio.run(_join_with_bad_ids())
+
+
+async def _join_full_table():
+    server = PokerServer()
+    listener = await asyncio.start_server(server.handle_client, '127.0.0.1', 0)
+    port = listener.sockets[0].getsockname()[1]
+    seated = []
+    try:
+        for i in range(6):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(json.dumps({'type': 'join', 'player_id': f'p{i}', 'name': f'player {i}'}).encode() + b'\n')
+            assert (await _read_message(reader))['type'] == 'join_success'
+            seated.append(writer)
+
+        # A seventh player, and one reusing a seated id, are both told the game is full
+        for join_id in ('p6', 'p0'):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(json.dumps({'type': 'join', 'player_id': join_id, 'name': 'late'}).encode() + b'\n')
+            assert (await _read_message(reader))['type'] == 'join_failed'
+            writer.close()
+            await writer.wait_closed()
+        await asyncio.sleep(0.05) # Let the rejected connections' handlers finish their cleanup
+
+        assert list(server.game.players) == [f'p{i}' for i in range(6)]
+        assert server.game.players['p0'].name == 'player 0'
+        assert 'p0' in server.clients
+    finally:
+        for writer in seated:
+            writer.close()
+        listener.close()
+        await listener.wait_closed()
+
+
+def test_join_full_table_keeps_seated_players():
+    asyncio.run(_join_full_table())
+
+
+def test_add_player_rejects_non_string_ids():
+    game = PokerGame()
+    assert not game.add_player(7, 'int id', None)
+    assert not game.add_player(None, 'no id', None)
+    assert not game.add_player('no-name', None, None)
+    assert game.add_player('alice-id', 'alice', None)
+    assert list(game.players) == ['alice-id']
+    assert json.loads(game.encode_common_state())['players']['alice-id']['name'] == 'alice'
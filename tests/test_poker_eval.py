@@ -0,0 +1,118 @@
+import random
+from collections import Counter
+from itertools import combinations
+
+import pytest
+
+from poker_eval import HAND_RANK_NAMES, SUIT_BITS, WORST_HAND_RANK, encode_card, eval_7cards, eval_batch, hand_category
+
+_RANKS = '23456789TJQKA'
+_SUITS = {'s': SUIT_BITS['spade'], 'h': SUIT_BITS['heart'], 'd': SUIT_BITS['diamond'], 'c': SUIT_BITS['club']}
+_DECK = [rank + suit for rank in _RANKS for suit in _SUITS]
+
+
+def _cards(text: str) -> list:
+    """'As Kd ...' -> evaluator card ints."""
+    return [encode_card(_RANKS.index(card[0]), _SUITS[card[1]]) for card in text.split()]
+
+
+def _reference_5(hand: list) -> tuple:
+    """Scores five 'As'-style cards as (category, tiebreak ranks); a larger tuple is a stronger hand."""
+    values = sorted((_RANKS.index(card[0]) + 2 for card in hand), reverse=True)
+    is_flush = len({card[1] for card in hand}) == 1
+    distinct = sorted(set(values), reverse=True)
+    straight_high = None
+    if len(distinct) == 5 and distinct[0] - distinct[4] == 4:
+        straight_high = distinct[0]
+    elif distinct == [14, 5, 4, 3, 2]: # Ace plays low in the wheel
+        straight_high = 5
+    groups = sorted(Counter(values).items(), key=lambda group: (group[1], group[0]), reverse=True)
+    shape = [count for _, count in groups]
+    by_group = [value for value, _ in groups]
+    if straight_high and is_flush:
+        return (9 if straight_high == 14 else 8, [straight_high])
+    if shape == [4, 1]:
+        return (7, by_group)
+    if shape == [3, 2]:
+        return (6, by_group)
+    if is_flush:
+        return (5, values)
+    if straight_high:
+        return (4, [straight_high])
+    if shape == [3, 1, 1]:
+        return (3, by_group)
+    if shape == [2, 2, 1]:
+        return (2, by_group)
+    if shape == [2, 1, 1, 1]:
+        return (1, by_group)
+    return (0, values)
+
+
+def _reference_7(hand: list) -> tuple:
+    """Best five-card score out of seven, by brute force over all 21 subsets."""
+    return max(_reference_5(five) for five in combinations(hand, 5))
+
+
+@pytest.mark.parametrize('hand, category', [
+    ('Ah Kh Qh Jh Th 2c 3d', 'Royal Flush'),
+    ('9s 8s 7s 6s 5s Ah Ad', 'Straight Flush'),
+    ('7c 7d 7h 7s Kd 2c 3h', 'Four of a Kind'),
+    ('Jc Jd Jh 4s 4d 9c 2h', 'Full House'),
+    ('Ad Jd 8d 6d 2d Kc Qs', 'Flush'),
+    ('Tc 9d 8h 7s 6c Ad Ah', 'Straight'),
+    ('Qc Qd Qh 9s 5d 3c 2h', 'Three of a Kind'),
+    ('Kc Kd 8h 8s 5d 3c 2h', 'Two Pair'),
+    ('Ac Ad 9h 7s 5d 3c 2h', 'One Pair'),
+    ('Ac Jd 9h 7s 5d 3c 2h', 'High Card'),
+])
+def test_category_of_known_hands(hand, category):
+    assert HAND_RANK_NAMES[hand_category(eval_7cards(_cards(hand)))] == category
+
+
+def test_rank_bounds():
+    assert eval_7cards(_cards('Ah Kh Qh Jh Th 2c 3d')) == 1
+    assert eval_7cards(_cards('7c 5d 4h 3s 2c')) == WORST_HAND_RANK
+
+
+def test_wheel_is_the_lowest_straight():
+    wheel = eval_7cards(_cards('Ac 2d 3h 4s 5c Kd 9h'))
+    six_high = eval_7cards(_cards('2c 3d 4h 5s 6c Kd 9h'))
+    assert HAND_RANK_NAMES[hand_category(wheel)] == 'Straight'
+    assert wheel > six_high # Lower rank is stronger
+    steel_wheel = eval_7cards(_cards('Ac 2c 3c 4c 5c Kd 9h'))
+    assert HAND_RANK_NAMES[hand_category(steel_wheel)] == 'Straight Flush'
+
+
+def test_flush_on_the_board():
+    board = _cards('Ah Kh 9h 6h 3h')
+    # Hole cards that do not improve the board all play the board's flush
+    board_only = eval_7cards(_cards('2c 2d') + board)
+    assert HAND_RANK_NAMES[hand_category(board_only)] == 'Flush'
+    assert eval_7cards(_cards('Qc Js') + board) == board_only
+    # A higher heart in the hole makes a better flush; a pair cannot beat the flush
+    assert eval_7cards(_cards('Qh 2c') + board) < board_only
+    assert eval_7cards(_cards('Ac Ad') + board) == board_only
+
+
+def test_batch_matches_single_evaluation():
+    rng = random.Random(7)
+    for _ in range(500):
+        num_players = rng.randint(2, 6)
+        dealt = rng.sample(_DECK, 2 * num_players + 5)
+        board = _cards(' '.join(dealt[:5]))
+        holes = [_cards(' '.join(dealt[5 + 2 * i:7 + 2 * i])) for i in range(num_players)]
+        assert eval_batch(holes, board) == [eval_7cards(hole + board) for hole in holes]
+
+
+def test_matches_brute_force_reference():
+    rng = random.Random(11)
+    hands = [rng.sample(_DECK, 7) for _ in range(1500)]
+    ranks = [eval_7cards(_cards(' '.join(hand))) for hand in hands]
+    references = [_reference_7(hand) for hand in hands]
+    for hand, rank, reference in zip(hands, ranks, references):
+        assert hand_category(rank) == reference[0], hand
+    for _ in range(5000):
+        i, j = rng.randrange(len(hands)), rng.randrange(len(hands))
+        # Lower evaluator rank is stronger, larger reference score is stronger
+        assert (ranks[i] < ranks[j]) == (references[i] > references[j]), (hands[i], hands[j])
+        assert (ranks[i] == ranks[j]) == (references[i] == references[j]), (hands[i], hands[j])
@@ -0,0 +1,23 @@
+import asyncio
+
+import poker_server
+from poker_server import PokerServer
+
+
+async def _start_and_stop(server: PokerServer):
+    serve_task = asyncio.create_task(server.start())
+    await asyncio.sleep(0.1)
+    serve_task.cancel()
+    try:
+        await serve_task
+    except asyncio.CancelledError:
+        pass
+    await asyncio.wait([server.game_loop_task], timeout=1)
+    assert server.game_loop_task.cancelled()
+
+
+def test_restarting_leaves_no_log_handlers_behind():
+    handlers_before = list(poker_server.logger.handlers)
+    for _ in range(2):
+        asyncio.run(_start_and_stop(PokerServer(host='127.0.0.1', port=0)))
+        assert poker_server.logger.handlers == handlers_before
@@ -0,0 +1,93 @@
+import random
+
+import pytest
+
+from poker_server import ALL_CARDS, PokerGame
+
+_RANKS = '23456789TJQKA'
+_SUITS = 'hdcs' # ALL_CARDS order: hearts, diamonds, clubs, spades
+
+
+def _dealt_game(num_players: int) -> PokerGame:
+    game = PokerGame()
+    for i in range(num_players):
+        game.add_player(f'p{i}', f'p{i}', None)
+    game.start_new_hand()
+    while len(game.community_cards) < 5:
+        game.advance_to_next_street()
+    return game
+
+
+def _card_indices(text: str) -> bytearray:
+    """'As Kd ...' -> ALL_CARDS indices."""
+    return bytearray(_SUITS.index(card[1]) * 13 + _RANKS.index(card[0]) for card in text.split())
+
+
+def _deal(game: PokerGame, holes: list, board: str):
+    """Replaces the dealt cards with the given hole cards and board."""
+    for player, hole in zip(game._plist, holes):
+        player.card_idx = _card_indices(hole)
+        player.cards = [ALL_CARDS[i] for i in player.card_idx]
+    game.board_idx = _card_indices(board)
+    game.community_cards = [ALL_CARDS[i] for i in game.board_idx]
+
+
+def _settle(game: PokerGame, bets: list, folded: list) -> dict:
+    """Applies a betting layout, runs determine_winners and returns each player's winnings."""
+    for player, bet, is_folded in zip(game._plist, bets, folded):
+        player.total_bet = bet
+        player.is_folded = is_folded
+        player.chips = 0
+    game.pot = sum(bets)
+    game.determine_winners()
+    return {player.id: player.chips for player in game._plist}
+
+
+def _assert_conserved(bets: list, folded: list, winnings: dict):
+    assert sum(winnings.values()) == sum(bets)
+    # Chips folded players put in above the highest live bet go to the last pot
+    top_live_bet = max(bet for bet, is_folded in zip(bets, folded) if not is_folded)
+    dead_excess = sum(max(0, bet - top_live_bet) for bet in bets)
+    for (player_id, won), bet in zip(winnings.items(), bets):
+        # Otherwise an all-in player wins at most their own level from every contributor
+        assert won <= sum(min(other_bet, bet) for other_bet in bets) + dead_excess
+
+
+@pytest.mark.parametrize('bets, folded', [
+    ([50, 100, 200], [False, False, False]),        # Three all-in levels
+    ([200, 200, 50, 50], [False, False, False, False]),
+    ([300, 100, 100], [True, False, False]),        # A folded player put in more than anyone left
+    ([40, 0, 0], [True, False, False]),             # Only dead money in the pot
+    ([20, 20, 20, 20, 20, 20], [False, True, False, True, False, True]),
+])
+def test_payout_equals_contributions(bets, folded):
+    _assert_conserved(bets, folded, _settle(_dealt_game(len(bets)), bets, folded))
+
+
+def test_payout_equals_contributions_for_random_all_in_layouts():
+    rng = random.Random(11)
+    for _ in range(500):
+        num_players = rng.randint(2, 6)
+        bets = [rng.choice([0, 10, 25, 40, 100, 250]) for _ in range(num_players)]
+        folded = [rng.random() < 0.3 for _ in range(num_players)]
+        if all(folded):
+            folded[0] = False
+        _assert_conserved(bets, folded, _settle(_dealt_game(num_players), bets, folded))
+
+
+@pytest.mark.parametrize('holes, board, bets, folded, expected', [
+    # Three all-ins at different stacks, best hand shortest, plus a folded contributor:
+    # main pot 4 x 50 to p0, side pot 100 + 100 + 50 dead to p1, p2 gets its uncalled 250 back
+    (['Jc Jd', '9c 9d', 'Ac Kd', 'Qc Qd'], '2c 7d 9h Js 3s',
+     [50, 150, 400, 100], [False, False, False, True],
+     {'p0': 200, 'p1': 250, 'p2': 250, 'p3': 0}),
+    # The board plays for everyone: the main pot of 91 splits with the odd chip to the first
+    # eligible player, and the side pot of 70 splits between the two deeper stacks
+    (['2c 3d', '4c 5d', '6c 7d', 'Ac Ad'], 'Ah Kh Qh Jh Th',
+     [25, 60, 60, 16], [False, False, False, True],
+     {'p0': 31, 'p1': 65, 'p2': 65, 'p3': 0}),
+])
+def test_exact_payouts(holes, board, bets, folded, expected):
+    game = _dealt_game(len(bets))
+    _deal(game, holes, board)
+    assert _settle(game, bets, folded) == expected